@@ -9,6 +9,7 @@ if getattr(sys, 'frozen', False):
         sys.exit(0)  # Another instance exists, exit immediately
 
 import subprocess
+from importlib.util import find_spec
 
 def install_requirements():
     """Auto-install missing dependencies (skip if frozen exe)"""
@@ -27,9 +28,8 @@ def install_requirements():
     }
 
     for module, package in required.items():
-        try:
-            __import__(module)
-        except ImportError:
+        # find_spec checks availability without importing heavy packages
+        if find_spec(module) is None:
             print(f"Installing {package}...")
             try:
                 subprocess.check_call([sys.executable, '-m', 'pip', 'install', package, '-q'])
@@ -44,55 +44,144 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QPushBu
                              QColorDialog, QMessageBox)
 from PyQt5.QtCore import Qt, QTimer, QPoint, pyqtSignal
 from PyQt5.QtGui import QColor, QCursor, QFont, QIcon, QPixmap, QPainter, QBrush
+import base64
+import io
 import json
 import os
-import requests
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+import random
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import ctypes
 from ctypes import wintypes
 import logging
 
-# Setup logging
-log_path = Path(os.getenv('APPDATA')) / 'ClaudeUsageBar' / 'debug.log'
-log_path.parent.mkdir(exist_ok=True)
-logging.basicConfig(
-    filename=str(log_path),
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logging.info("App starting")
+# Win32 window functions, bound once with explicit signatures
+try:
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    SetWindowPos = _user32.SetWindowPos
+    SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                             ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    SetWindowPos.restype = wintypes.BOOL
+    GetWindowLongW = _user32.GetWindowLongW
+    GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    GetWindowLongW.restype = wintypes.LONG
+    SetWindowLongW = _user32.SetWindowLongW
+    SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    SetWindowLongW.restype = wintypes.LONG
+except (AttributeError, OSError):  # Not running on Windows
+    SetWindowPos = GetWindowLongW = SetWindowLongW = None
 
-# System Tray
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
-except ImportError:
-    TRAY_AVAILABLE = False
+    DwmSetWindowAttribute = ctypes.WinDLL('dwmapi').DwmSetWindowAttribute
+    DwmSetWindowAttribute.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+    DwmSetWindowAttribute.restype = ctypes.c_long  # HRESULT
+except (AttributeError, OSError):
+    DwmSetWindowAttribute = None
+
+HWND_TOPMOST = wintypes.HWND(-1)
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOACTIVATE = 0x0010
+GWL_EXSTYLE = -20
+WS_EX_TRANSPARENT = 0x00000020
+WS_EX_LAYERED = 0x00080000
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+_DARK_MODE_ON = ctypes.c_int(1)
+
+# Optional dependencies are only checked here and imported on first use
+# (undetected_chromedriver pulls in selenium, which is slow to import)
+
+# System Tray
+TRAY_AVAILABLE = find_spec('pystray') is not None and find_spec('PIL') is not None
 
 # Undetected Chrome for auto session grab
-try:
-    import undetected_chromedriver as uc
-    CHROMEDRIVER_AVAILABLE = True
-    logging.info("undetected_chromedriver loaded successfully")
-except ImportError as e:
-    CHROMEDRIVER_AVAILABLE = False
-    logging.warning(f"undetected_chromedriver not available: {e}")
+CHROMEDRIVER_AVAILABLE = find_spec('undetected_chromedriver') is not None
 
 # Global hotkeys
-try:
-    import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
+KEYBOARD_AVAILABLE = find_spec('keyboard') is not None
+
+# Headers sent with every claude.ai API request
+API_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://claude.ai/chats',
+}
+
+# Tray icon: 64x64 orange circle on transparent background, pre-rendered PNG
+_TRAY_ICON_PNG = base64.b64decode(
+    b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABFklEQVR42u2byxHDIAxEkWpKOS4k'
+    b'JaSQlJOe4ktOmbH5WBgk3p49Yfdp4WCHlBBCK0vuXOzz3L6lzz5eb3EPoCbwKCAye/DeIMRL8F4g'
+    b'xFtwaxDqObzF+uo5vIUP8RzcYktopPAt/jRS+BafmhaXRpt+rV+NGL7Gt0YNX+qfMyDy9Ety0IDo'
+    b'08/loQErTP8sFw0AAADW2P9H+WgAAAAAAAAAAAAAAAAAfrrrnxmj9J+PBgAAAPl9EnX/04AzANFa'
+    b'cJSHBrRQizJ9GlACwHsLcv7V4ke8hq/aAt4glPrlDOhB1cv0mxowO4Raf5fCzPQZrXUwOmLRWcKb'
+    b'HIKjIVxdnxsjPcwte2eoJwhXt8YsgER/O43QJNoBflSEaChNNOMAAAAASUVORK5CYII='
+)
+
+
+@lru_cache(maxsize=8)
+def _parse_iso(value):
+    """Parse an API timestamp to an aware datetime (same string is only parsed once)"""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        from dateutil import parser as date_parser  # Formats fromisoformat can't read
+        parsed = date_parser.parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()  # Naive times are local
+    return parsed
+
+
+def _seconds_until(reset_dt, now):
+    """Seconds from now (aware) until a parsed reset time, 0 if there is none"""
+    if reset_dt is None:
+        return 0
+    return (reset_dt - now).total_seconds()
+
+
+def setup_logging():
+    """Log to debug.log in the app data folder (called at startup, not on import)"""
+    log_path = Path(os.getenv('APPDATA')) / 'ClaudeUsageBar' / 'debug.log'
+    log_path.parent.mkdir(exist_ok=True)
+    logging.basicConfig(
+        filename=str(log_path),
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    logging.info("App starting")
+    if not CHROMEDRIVER_AVAILABLE:
+        logging.warning("undetected_chromedriver not available")
 
 
 
 class HotkeyEdit(QLineEdit):
     """Custom QLineEdit that captures hotkey combinations"""
+    MODIFIER_NAMES = (
+        (Qt.ControlModifier, "ctrl"),
+        (Qt.AltModifier, "alt"),
+        (Qt.ShiftModifier, "shift"),
+    )
+    SPECIAL_KEY_NAMES = {
+        Qt.Key_Space: "space",
+        Qt.Key_Return: "enter",
+        Qt.Key_Enter: "enter",
+        Qt.Key_Tab: "tab",
+        Qt.Key_Up: "up",
+        Qt.Key_Down: "down",
+        Qt.Key_Left: "left",
+        Qt.Key_Right: "right",
+        Qt.Key_Home: "home",
+        Qt.Key_End: "end",
+        Qt.Key_Delete: "delete",
+        Qt.Key_Insert: "insert",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setPlaceholderText("Press keys...")
@@ -112,44 +201,17 @@ class HotkeyEdit(QLineEdit):
             event.accept()
             return
 
-        parts = []
-        if modifiers & Qt.ControlModifier:
-            parts.append("ctrl")
-        if modifiers & Qt.AltModifier:
-            parts.append("alt")
-        if modifiers & Qt.ShiftModifier:
-            parts.append("shift")
+        parts = [name for mask, name in self.MODIFIER_NAMES if modifiers & mask]
 
         # Get key name
-        key_name = None
-        if Qt.Key_A <= key <= Qt.Key_Z:
-            key_name = chr(key).lower()
-        elif Qt.Key_0 <= key <= Qt.Key_9:
-            key_name = chr(key)
-        elif Qt.Key_F1 <= key <= Qt.Key_F12:
-            key_name = f"f{key - Qt.Key_F1 + 1}"
-        elif key == Qt.Key_Space:
-            key_name = "space"
-        elif key == Qt.Key_Return or key == Qt.Key_Enter:
-            key_name = "enter"
-        elif key == Qt.Key_Tab:
-            key_name = "tab"
-        elif key == Qt.Key_Up:
-            key_name = "up"
-        elif key == Qt.Key_Down:
-            key_name = "down"
-        elif key == Qt.Key_Left:
-            key_name = "left"
-        elif key == Qt.Key_Right:
-            key_name = "right"
-        elif key == Qt.Key_Home:
-            key_name = "home"
-        elif key == Qt.Key_End:
-            key_name = "end"
-        elif key == Qt.Key_Delete:
-            key_name = "delete"
-        elif key == Qt.Key_Insert:
-            key_name = "insert"
+        key_name = self.SPECIAL_KEY_NAMES.get(key)
+        if key_name is None:
+            if Qt.Key_A <= key <= Qt.Key_Z:
+                key_name = chr(key).lower()
+            elif Qt.Key_0 <= key <= Qt.Key_9:
+                key_name = chr(key)
+            elif Qt.Key_F1 <= key <= Qt.Key_F12:
+                key_name = f"f{key - Qt.Key_F1 + 1}"
 
         if key_name and parts:  # Require at least one modifier
             parts.append(key_name)
@@ -163,12 +225,76 @@ class HotkeyEdit(QLineEdit):
         self.selectAll()
 
 
+class OverlayButton(QPushButton):
+    """Small borderless header button for the overlay"""
+    def __init__(self, text, tooltip, parent=None):
+        super().__init__(text, parent)
+        self.setToolTip(tooltip)
+        self.setFixedSize(24, 24)
+        self.setAutoFillBackground(False)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setAttribute(Qt.WA_Hover, True)
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+
+
 class ClaudeUsageBar(QMainWindow):
     # Signals for hotkey callbacks (thread-safe)
     hotkey_clickthrough_signal = pyqtSignal()
     hotkey_compact_signal = pyqtSignal()
     hotkey_refresh_signal = pyqtSignal()
 
+    # Signal for results from the polling worker
+    poll_result_signal = pyqtSignal(object)
+
+    # Signals for the sign-in worker (status text + color, then the session key or None)
+    login_status_signal = pyqtSignal(str, str)
+    login_result_signal = pyqtSignal(object)
+
+    # Signal for the tray menu's Quit (pystray runs its menu on its own thread)
+    tray_quit_signal = pyqtSignal()
+
+    # Stylesheet templates (filled with str.format_map, or % for the floating button)
+    _LABEL_QSS = """
+        QLabel[role="title"] {{ {bg} color: #aaaaaa; font-size: 12px; font-weight: bold; }}
+        QLabel[role="usage"] {{ {bg} color: #cccccc; font-size: {size}px; }}
+        QLabel[role="reset"] {{ {bg} color: #999999; font-size: {size}px; }}
+        QLabel[role="prediction"] {{ {bg} color: #aaaaaa; font-size: 11px; font-style: italic; }}
+    """
+    _TEXT_BG = "background-color: rgba(42, 42, 42, {opacity}); border-radius: 2px;"
+    _FLOAT_BTN_QSS = """
+        QPushButton {
+            background-color: rgba(26, 26, 26, %d);
+            color: #44ff44;
+            border: none;
+            font-size: 10px;
+            padding: 5px;
+            margin: 0px;
+            outline: none;
+        }
+        QPushButton:hover {
+            background: rgba(255, 255, 255, 0.2);
+            color: #ffffff;
+            border: none;
+            border-radius: 3px;
+        }
+        QPushButton:focus {
+            outline: none;
+            border: none;
+        }
+    """
+    _NO_TEXT_BG = ""
+    # Settings dialog controls
+    _SLIDER_QSS = (
+        "QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }"
+        "QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }"
+    )
+    _COLOR_BTN_QSS = "background-color: %s; color: %s; padding: 8px;"
+    _THRESHOLD_CANDIDATES = tuple(range(50, 101, 5)) + tuple(range(1, 101))  # Order new alerts are picked in
+    _ALERT_PREFIXES = ("5-hour_", "weekly_")  # Key prefixes in notified_thresholds, one per limit
+    # Main frame background for every alpha (minimum 3 so the window stays draggable).
+    # Scoped to the frame itself so children don't each repaint the translucent fill.
+    _FRAME_BG_QSS = tuple(f"QFrame#mainFrame {{ background-color: rgba(26, 26, 26, {max(a, 3)}); }}" for a in range(256))
+
     def __init__(self):
         super().__init__()
         self.setFocusPolicy(Qt.NoFocus)
@@ -177,16 +303,28 @@ class ClaudeUsageBar(QMainWindow):
         self.hotkey_clickthrough_signal.connect(self.toggle_clickthrough)
         self.hotkey_compact_signal.connect(self.toggle_compact_mode)
         self.hotkey_refresh_signal.connect(self.manual_refresh)
+        self.poll_result_signal.connect(self._on_poll_result)
+        self.tray_quit_signal.connect(self.quit_app)
 
         # Paths
         self.app_data_dir = Path(os.getenv('APPDATA')) / 'ClaudeUsageBar'
         self.app_data_dir.mkdir(exist_ok=True)
         self.config_file = self.app_data_dir / 'config.json'
 
+        # Config writes are coalesced and flushed after a short delay
+        self._config_dirty = False
+        self._last_config_bytes = None  # Serialized config last written to disk
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_config)
+        QApplication.instance().aboutToQuit.connect(self._flush_config)
+
         # Load config
         self.config = self.load_config()
+        self._refresh_config_cache()
 
         # Validate position
+        self._monitors = None  # Screen geometry cache, cleared on display changes
         self.validate_position()
 
         # State
@@ -194,6 +332,7 @@ class ClaudeUsageBar(QMainWindow):
         self.drag_position = QPoint()
         self.usage_data = None
         self.polling_active = True
+        self._shutdown = threading.Event()  # Set on quit; wakes worker-side waits immediately
         self.driver = None
         self.login_in_progress = False
         self.settings_window = None
@@ -205,14 +344,45 @@ class ClaudeUsageBar(QMainWindow):
         self.retry_count = 0
         self.tray_icon = None
         self.is_hidden = False
-        self.floating_btn = None  # Floating clickthrough button for when clickthrough is active
+        self.floating_btn = None  # Floating clickthrough button, created the first time clickthrough is enabled
         self.last_five_hour_utilization = 0
         self.last_weekly_utilization = 0
         self.snapped_edge = None
         self.collapsed = False
         self.notified_thresholds = set()  # Track which thresholds have been notified
         self.initial_thresholds_set = False  # Skip notifications on first fetch
-        self.usage_history = []  # Track usage for prediction (timestamp, utilization)
+        self.usage_history = deque(maxlen=1024)  # Track usage for prediction (timestamp, utilization)
+        self._label_style_key = None  # Config values the label stylesheet was built from
+        self._batch_depth = 0  # Nesting level of _batch_style blocks
+        self._border_state = None  # (shown, color, width, height) the border overlays were laid out for
+        self._bar_height = None  # Progress bar height last applied
+        self._applied_alpha = None  # Window background alpha last applied
+        self._label_texts = {}  # Usage label -> text last set by update_progress
+        self._bar_widths = {}  # Progress bar fill -> (track width, utilization) last applied
+        self._mci_state = {}  # MCI alias -> (open file, volume) for custom alert sounds
+        self._last_tooltip = None  # Tray tooltip text last set
+        self._app_icon = None  # Built on first use by get_app_icon
+        self._fetch_pool = ThreadPoolExecutor(max_workers=1)  # Single worker for polls and manual refreshes
+        self._fetch_inflight = False
+        self._scraper = None  # Created on first fetch, reused so connections and Cloudflare clearance persist
+        self._cookie_signature = None  # Cookie string currently loaded into the scraper
+        self._org_id = self.config.get('cached_org_id')  # Saved from the last successful lookup
+
+        # Polling timer (single-shot, re-armed after each fetch completes)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.setTimerType(Qt.VeryCoarseTimer)  # Whole-second accuracy is plenty for a 60s poll
+        self._poll_timer.timeout.connect(self._poll_once)
+
+        # Floating button follows the window at most once per frame while dragging
+        self._float_move_timer = QTimer(self)
+        self._float_move_timer.setSingleShot(True)
+        self._float_move_timer.timeout.connect(self.update_floating_button_position)
+
+        # Hotkey edits re-register global hotkeys once typing settles
+        self._hotkey_timer = QTimer(self)
+        self._hotkey_timer.setSingleShot(True)
+        self._hotkey_timer.timeout.connect(self.setup_hotkeys)
 
         # Setup window
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -221,7 +391,6 @@ class ClaudeUsageBar(QMainWindow):
         # Setup UI
         self.setup_ui()
         self.position_window()
-        self.create_floating_button()
 
         # Apply compact mode if enabled
         if self.config.get('compact_mode', False):
@@ -230,10 +399,16 @@ class ClaudeUsageBar(QMainWindow):
         # Force topmost using Windows API
         self.force_topmost()
 
-        # Start periodic monitor check
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self.check_monitor_bounds)
-        self.monitor_timer.start(2000)  # Check every 2 seconds
+        # Re-check monitor bounds whenever the display configuration changes.
+        # A hot-plug emits several signals in a row, so checks are coalesced.
+        self._monitor_check_timer = QTimer(self)
+        self._monitor_check_timer.setSingleShot(True)
+        self._monitor_check_timer.timeout.connect(self.check_monitor_bounds)
+        app = QApplication.instance()
+        app.screenAdded.connect(self.on_screen_added)
+        app.screenRemoved.connect(self.schedule_monitor_check)
+        for screen in app.screens():
+            screen.geometryChanged.connect(self.schedule_monitor_check)
 
         # Initialize system tray
         if TRAY_AVAILABLE:
@@ -290,88 +465,133 @@ class ClaudeUsageBar(QMainWindow):
 
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded = json.load(f)
-                    return {**default, **loaded}
-            except:
-                pass
+                with open(self.config_file, 'rb') as f:
+                    loaded = json.loads(f.read())
+                default.update(loaded)
+            except (OSError, ValueError, TypeError) as e:
+                logging.error(f"Failed to load config: {e}")
 
         return default
 
     def save_config(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
-
-    def get_monitors(self):
-        """Enumerate all active monitors using ctypes"""
-        monitors = []
+        """Refresh cached values and schedule a write of the config"""
+        self._refresh_config_cache()
+        self._config_dirty = True
+        self._save_timer.start(500)
+
+    def _flush_config(self):
+        """Write pending config changes to disk (atomic replace)"""
+        self._save_timer.stop()
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        data = json.dumps(self.config, separators=(',', ':')).encode('utf-8')
+        if data == self._last_config_bytes:
+            return  # Same as what is already on disk
+        tmp_file = self.config_file.with_suffix('.json.tmp')
         try:
-            def monitor_enum_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
-                rect = lprcMonitor.contents
-                monitors.append({
-                    'left': rect.left,
-                    'top': rect.top,
-                    'right': rect.right,
-                    'bottom': rect.bottom
-                })
-                return True
-
-            MonitorEnumProc = ctypes.WINFUNCTYPE(
-                ctypes.c_bool,
-                wintypes.HMONITOR,
-                wintypes.HDC,
-                ctypes.POINTER(wintypes.RECT),
-                wintypes.LPARAM
-            )
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._last_config_bytes = data
+        except OSError as e:
+            logging.error(f"Config save error: {e}")
+
+    def _refresh_config_cache(self):
+        """Cache config values read on hot paths (refreshed on every save)"""
+        cfg = self.config
+        self._compact = bool(cfg.get('compact_mode', False))
+        self._alpha = min(255, max(0, int(cfg.get('opacity', 0.9) * 255)))  # Window background alpha (0-255)
+        self._close_action = self.hide_to_tray if (TRAY_AVAILABLE and cfg.get('minimize_to_tray')) else self.quit_app
+        self._show_prediction = bool(cfg.get('show_prediction', True))
+        self._dynamic_bar_color = bool(cfg.get('dynamic_bar_color', True))
+        self._warning_color_90 = cfg.get('warning_color_90', '#ff4444')
+        self._warning_color_70 = cfg.get('warning_color_70', '#ffaa44')
+        self._five_hour_color = cfg.get('five_hour_color', '#CC785C')
+        self._weekly_color = cfg.get('weekly_color', '#8B6BB7')
+        self._notifications_enabled = bool(cfg.get('notifications_enabled', True))
+        # (threshold, notified key) pairs per limit, in ascending threshold order
+        thresholds = sorted(cfg.get('notification_thresholds', [70, 90]))
+        self._threshold_keys = {
+            prefix[:-1]: tuple((threshold, f"{prefix}{threshold}") for threshold in thresholds)
+            for prefix in self._ALERT_PREFIXES
+        }
 
-            ctypes.windll.user32.EnumDisplayMonitors(None, None, MonitorEnumProc(monitor_enum_proc), 0)
-        except Exception:
-            pass
+    def _set_bar_width(self, fill, bg, utilization):
+        """Size a progress bar fill to the given utilization percentage"""
+        key = (bg.width(), utilization)
+        if self._bar_widths.get(fill) != key:
+            self._bar_widths[fill] = key
+            fill.setFixedWidth(int((utilization / 100) * key[0]))
+
+    def _set_text(self, label, text):
+        """Set a usage label's text only when it differs from what was last set"""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.setText(text)
+
+    def _set_bar_color(self, fill, color):
+        """Restyle a progress bar fill only when its color changes"""
+        if fill.property('fill_color') != color:
+            fill.setProperty('fill_color', color)
+            fill.setStyleSheet(self._fill_qss(color))
+
+    def _bar_color(self, utilization, base_color):
+        """Fill color for a usage bar, switching to warning colors when dynamic"""
+        if self._dynamic_bar_color:
+            if utilization >= 90:
+                return self._warning_color_90
+            if utilization >= 70:
+                return self._warning_color_70
+        return base_color
 
-        return monitors
+    def get_monitors(self):
+        """List (left, top, right, bottom) for all connected screens"""
+        if self._monitors is None:
+            monitors = []
+            for screen in QApplication.screens():
+                geo = screen.geometry()
+                monitors.append((geo.x(), geo.y(), geo.x() + geo.width(), geo.y() + geo.height()))
+            self._monitors = tuple(monitors)
+        return self._monitors
+
+    def _is_visible(self, x, y):
+        """Check if a window position is on a connected monitor"""
+        monitors = self.get_monitors()
+        if not monitors:
+            return True  # Nothing to compare against, leave the window alone
+        for left, top, right, bottom in monitors:
+            if left <= x < right - 10 and top <= y < bottom - 10:
+                return True
+        return False
 
     def validate_position(self):
         """Ensure the window position is within a visible monitor"""
-        x = self.config['position']['x']
-        y = self.config['position']['y']
-
-        monitors = self.get_monitors()
+        if not self._is_visible(self.config['position']['x'], self.config['position']['y']):
+            self.config['position']['x'] = 20
+            self.config['position']['y'] = 80
+            self.save_config()
 
-        if not monitors:
-            return
+    def on_screen_added(self, screen):
+        """Watch a newly connected screen and re-check window position"""
+        screen.geometryChanged.connect(self.schedule_monitor_check)
+        self.schedule_monitor_check()
 
-        is_visible = False
-        for m in monitors:
-            if (m['left'] <= x < m['right'] - 10) and (m['top'] <= y < m['bottom'] - 10):
-                is_visible = True
-                break
+    def schedule_monitor_check(self):
+        """Run check_monitor_bounds once after a burst of display changes"""
+        self._monitors = None
+        self._monitor_check_timer.start(250)
 
-        if not is_visible:
+    def check_monitor_bounds(self):
+        """Check if window is still on a visible monitor (on display changes)"""
+        if not self.dragging and not self._is_visible(self.x(), self.y()):
+            self.move(20, 80)
             self.config['position']['x'] = 20
             self.config['position']['y'] = 80
             self.save_config()
 
-    def check_monitor_bounds(self):
-        """Periodically check if window is still on a visible monitor"""
-        if not self.dragging:
-            x = self.x()
-            y = self.y()
-
-            monitors = self.get_monitors()
-
-            if monitors:
-                is_visible = False
-                for m in monitors:
-                    if (m['left'] <= x < m['right'] - 10) and (m['top'] <= y < m['bottom'] - 10):
-                        is_visible = True
-                        break
-
-                if not is_visible:
-                    self.move(20, 80)
-                    self.config['position']['x'] = 20
-                    self.config['position']['y'] = 80
-                    self.save_config()
-
     def setup_ui(self):
         # Central widget
         central = QWidget()
@@ -385,7 +605,7 @@ class ClaudeUsageBar(QMainWindow):
 
         # Main frame
         self.main_frame = QFrame()
-        self.main_frame.setStyleSheet("background-color: #1a1a1a;")
+        self.main_frame.setObjectName("mainFrame")  # Background set by apply_background_opacity
         self.main_frame.setCursor(QCursor(Qt.ArrowCursor))
         main_layout.addWidget(self.main_frame)
 
@@ -403,50 +623,96 @@ class ClaudeUsageBar(QMainWindow):
         # Set window size and apply background opacity
         self.setFixedSize(300, 240)
         self.full_height = 240  # Store for non-compact mode restore
-        self.apply_background_opacity()
-        self.apply_progress_bar_height()  # Apply saved bar height (also adjusts window)
-        self.apply_font_size()
-        self.apply_border()
-        self.apply_text_backgrounds()
+        with self._batch_style():
+            self.apply_background_opacity()
+            self.apply_progress_bar_height()  # Apply saved bar height (also adjusts window)
+            self.apply_font_size()
+            self.apply_border()
+            self.apply_text_backgrounds()
+
+        # Elements that stay draggable in clickthrough mode (set for O(1) lookups on press)
+        self.draggable_widgets = frozenset((
+            self.title_label, self.five_hour_progress_bg, self.five_hour_progress_fill,
+            self.five_hour_border_overlay, self.weekly_progress_bg,
+            self.weekly_progress_fill, self.weekly_border_overlay,
+            self.five_hour_usage_label, self.five_hour_reset_label,
+            self.five_hour_title, self.weekly_usage_label,
+            self.weekly_reset_label, self.weekly_title
+        ))
+
+    def _set_style(self, widget, qss):
+        """Set a widget stylesheet, skipping the re-polish if it is unchanged"""
+        if widget.styleSheet() != qss:
+            widget.setStyleSheet(qss)
+
+    def _settle_layout(self):
+        """Lay out the nested frames now (innermost first) so sizes and size hints are current"""
+        self.content_layout.activate()
+        self.frame_layout.activate()
+        self.centralWidget().layout().activate()
+
+    @contextmanager
+    def _batch_style(self):
+        """Suspend repaints while several style/geometry changes are applied"""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._settle_layout()
+                self.setUpdatesEnabled(True)
+                self.update()
 
     def apply_border(self):
         """Apply border setting to progress bars"""
-        if self.config.get('show_border', False):
-            border_color = self.config.get('border_color', '#FFFFFF')
-            self.five_hour_border_overlay.setGeometry(0, 0, self.five_hour_progress_bg.width(), self.five_hour_progress_bg.height())
-            self.five_hour_border_overlay.setStyleSheet(f"background-color: transparent; border: 1px solid {border_color};")
-            self.five_hour_border_overlay.show()
-            self.five_hour_border_overlay.raise_()
-            self.weekly_border_overlay.setGeometry(0, 0, self.weekly_progress_bg.width(), self.weekly_progress_bg.height())
-            self.weekly_border_overlay.setStyleSheet(f"background-color: transparent; border: 1px solid {border_color};")
-            self.weekly_border_overlay.show()
-            self.weekly_border_overlay.raise_()
-        else:
-            self.five_hour_border_overlay.hide()
-            self.weekly_border_overlay.hide()
+        cfg = self.config
+        show_border = cfg.get('show_border', False)
+        border_color = cfg.get('border_color', '#FFFFFF')
+
+        # Nothing to do if the setting and bar geometry are unchanged
+        state = (show_border, border_color, self.five_hour_progress_bg.width(), self.five_hour_progress_bg.height())
+        if state == self._border_state:
+            return
+        self._border_state = state
+
+        with self._batch_style():
+            if show_border:
+                border_style = self._border_qss(border_color)
+                self.five_hour_border_overlay.setGeometry(0, 0, self.five_hour_progress_bg.width(), self.five_hour_progress_bg.height())
+                self._set_style(self.five_hour_border_overlay, border_style)
+                self.five_hour_border_overlay.show()
+                self.five_hour_border_overlay.raise_()
+                self.weekly_border_overlay.setGeometry(0, 0, self.weekly_progress_bg.width(), self.weekly_progress_bg.height())
+                self._set_style(self.weekly_border_overlay, border_style)
+                self.weekly_border_overlay.show()
+                self.weekly_border_overlay.raise_()
+            else:
+                self.five_hour_border_overlay.hide()
+                self.weekly_border_overlay.hide()
 
     def apply_font_size(self):
         """Apply font size to all labels"""
-        size = self.config.get('font_size', 15)
-        self.five_hour_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {size}px;")
-        self.five_hour_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {size}px;")
-        self.weekly_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {size}px;")
-        self.weekly_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {size}px;")
-
-        # Adjust window height (4 labels affected, ~1.5px extra per px above default 15)
-        self.recalculate_window_height()
+        with self._batch_style():
+            self.apply_label_styles()
 
-        # Reapply text backgrounds if enabled
-        if self.config.get('text_background', False):
-            self.apply_text_backgrounds()
+            # Adjust window height (4 labels affected, ~1.5px extra per px above default 15)
+            self.recalculate_window_height()
 
     def apply_progress_bar_height(self):
         """Apply progress bar height setting"""
         height = self.config.get('progress_bar_height', 12)
-        self.five_hour_progress_bg.setFixedHeight(height)
-        self.weekly_progress_bg.setFixedHeight(height)
+        if height == self._bar_height:
+            return
+        self._bar_height = height
 
-        self.recalculate_window_height()
+        with self._batch_style():
+            self.five_hour_progress_bg.setFixedHeight(height)
+            self.weekly_progress_bg.setFixedHeight(height)
+
+            self.recalculate_window_height()
 
         # Reapply border if enabled
         if self.config.get('show_border', False):
@@ -454,55 +720,88 @@ class ClaudeUsageBar(QMainWindow):
 
     def recalculate_window_height(self):
         """Recalculate window height based on font size and bar height"""
+        cfg = self.config
         base_height = 240
 
         # Extra for progress bar height (default 12px)
-        bar_height = self.config.get('progress_bar_height', 12)
+        bar_height = cfg.get('progress_bar_height', 12)
         bar_extra = (bar_height - 12) * 2  # *2 for both bars
 
         # Extra for font size (default 15px, 4 labels affected)
-        font_size = self.config.get('font_size', 15)
+        font_size = cfg.get('font_size', 15)
         font_extra = int((font_size - 15) * 4)  # 4 labels
 
         new_full_height = base_height + bar_extra + font_extra
         self.full_height = new_full_height
 
-        if not self.config.get('compact_mode', False):
+        if not self._compact:
             self.setFixedSize(300, new_full_height)
 
     def apply_text_backgrounds(self):
         """Apply background to text labels"""
-        size = self.config.get('font_size', 15)
-        if self.config.get('text_background', False):
-            opacity = int(self.config.get('text_background_opacity', 70) * 255 / 100)
-            bg_style = f"background-color: rgba(42, 42, 42, {opacity}); border-radius: 2px;"
-            self.five_hour_title.setStyleSheet(f"{bg_style} color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.five_hour_usage_label.setStyleSheet(f"{bg_style} color: #cccccc; font-size: {size}px;")
-            self.five_hour_reset_label.setStyleSheet(f"{bg_style} color: #999999; font-size: {size}px;")
-            self.prediction_label.setStyleSheet(f"{bg_style} color: #aaaaaa; font-size: 11px; font-style: italic;")
-            self.weekly_title.setStyleSheet(f"{bg_style} color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.weekly_usage_label.setStyleSheet(f"{bg_style} color: #cccccc; font-size: {size}px;")
-            self.weekly_reset_label.setStyleSheet(f"{bg_style} color: #999999; font-size: {size}px;")
+        with self._batch_style():
+            self.apply_label_styles()
+
+    def apply_label_styles(self):
+        """Style all content labels with one stylesheet on the content frame"""
+        cfg = self.config
+        size = cfg.get('font_size', 15)
+        text_background = cfg.get('text_background', False)
+        text_bg_opacity = cfg.get('text_background_opacity', 70)
+
+        # Skip the re-parse when nothing that affects the labels has changed
+        key = (size, text_background, text_bg_opacity)
+        if key == self._label_style_key:
+            return
+        self._label_style_key = key
+
+        self.content_frame.setStyleSheet(self._label_qss(*key))
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _label_qss(cls, size, text_background, text_bg_opacity):
+        """Content label stylesheet for the given font size and text background"""
+        if text_background:
+            bg_style = cls._TEXT_BG.format_map({'opacity': int(text_bg_opacity * 255 / 100)})
         else:
-            self.five_hour_title.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.five_hour_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {size}px;")
-            self.five_hour_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {size}px;")
-            self.prediction_label.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 11px; font-style: italic;")
-            self.weekly_title.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.weekly_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {size}px;")
-            self.weekly_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {size}px;")
+            bg_style = cls._NO_TEXT_BG
+        return cls._LABEL_QSS.format_map({'bg': bg_style, 'size': size})
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _fill_qss(color):
+        """Progress bar fill stylesheet"""
+        return f"background-color: {color}; border: none;"
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _border_qss(color):
+        """Progress bar border overlay stylesheet"""
+        return f"background-color: transparent; border: 1px solid {color};"
 
     def showEvent(self, event):
-        """Update border geometry when window is shown"""
+        """Update border geometry (and usage widgets after the tray) when window is shown"""
         super().showEvent(event)
         # Reapply border after layout is finalized
         if self.config.get('show_border', False):
             QTimer.singleShot(0, self.apply_border)
+        # Polls that landed while hidden in the tray only updated alerts and the tooltip
+        # (the hidden polls already recorded their prediction samples, so this one doesn't)
+        if self.is_hidden and self.usage_data:
+            QTimer.singleShot(0, lambda: self.update_progress(record_sample=False))
+
+    def resizeEvent(self, event):
+        """Refit the progress bar fills to the resized tracks"""
+        super().resizeEvent(event)
+        for fill, bg in ((self.five_hour_progress_fill, self.five_hour_progress_bg),
+                         (self.weekly_progress_fill, self.weekly_progress_bg)):
+            applied = self._bar_widths.get(fill)
+            if applied:
+                self._set_bar_width(fill, bg, applied[1])
 
     def setup_header(self, parent_layout):
         """Setup header with title and buttons"""
         self.header = QFrame()
-        self.header.setStyleSheet("background: transparent;")
         self.header.setFixedHeight(28)
         parent_layout.addWidget(self.header)
 
@@ -512,16 +811,13 @@ class ClaudeUsageBar(QMainWindow):
         self.header.setLayout(header_layout)
 
         # Clickthrough button
-        self.clickthrough_btn = QPushButton("👆")
-        self.clickthrough_btn.setToolTip("Enable Clickthrough")
-        self.clickthrough_btn.setFixedSize(24, 24)
-        self.clickthrough_btn.setAutoFillBackground(False)
-        self.clickthrough_btn.setFocusPolicy(Qt.NoFocus)
-        self.clickthrough_btn.setAttribute(Qt.WA_Hover, True)
+        self.clickthrough_btn = OverlayButton("👆", "Enable Clickthrough")
         # Retain space when hidden so layout doesn't shift
         sp = self.clickthrough_btn.sizePolicy()
         sp.setRetainSizeWhenHidden(True)
         self.clickthrough_btn.setSizePolicy(sp)
+        # Idle and active looks live in one sheet, switched by the "state" property
+        self.clickthrough_btn.setProperty("state", "idle")
         self.clickthrough_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(0, 0, 0, 0.01);
@@ -542,23 +838,27 @@ class ClaudeUsageBar(QMainWindow):
                 outline: none;
                 border: none;
             }
+            QPushButton[state="active"] {
+                background: rgba(0, 0, 0, 0.01);
+                color: #44ff44;
+                border: 1px solid transparent;
+                font-size: 12px;
+            }
         """)
         self.clickthrough_btn.clicked.connect(self.toggle_clickthrough)
-        self.clickthrough_btn.setCursor(QCursor(Qt.PointingHandCursor))
         header_layout.addWidget(self.clickthrough_btn)
 
         # API status dot
         self.api_status_dot = QLabel("●")
         self.api_status_dot.setAutoFillBackground(False)
         self.api_status_dot.setAttribute(Qt.WA_TranslucentBackground)
-        self.api_status_dot.setStyleSheet("color: #aaaaaa; background: transparent; font-size: 12px; padding: 0px; margin: 0px;")
+        self.api_status_dot.setStyleSheet("color: #aaaaaa; font-size: 12px; padding: 0px; margin: 0px;")
         self.api_status_dot.setFixedSize(12, 12)
         header_layout.addWidget(self.api_status_dot)
 
         # Title label (draggable)
         self.title_label = QLabel("Claude Usage")
         self.title_label.setStyleSheet("""
-            background: transparent;
             color: #CC785C;
             font-weight: bold;
             font-size: 15px;
@@ -576,7 +876,6 @@ class ClaudeUsageBar(QMainWindow):
         self.btn_frame = QFrame()
         self.btn_frame.setAutoFillBackground(False)
         self.btn_frame.setAttribute(Qt.WA_TranslucentBackground)
-        self.btn_frame.setStyleSheet("background: transparent;")
         btn_layout = QHBoxLayout()
         btn_layout.setContentsMargins(0, 0, 0, 0)
         btn_layout.setSpacing(8)
@@ -584,12 +883,7 @@ class ClaudeUsageBar(QMainWindow):
         header_layout.addWidget(self.btn_frame)
 
         # Compact button
-        self.compact_btn = QPushButton("─")
-        self.compact_btn.setToolTip("Compact")
-        self.compact_btn.setFixedSize(24, 24)
-        self.compact_btn.setAutoFillBackground(False)
-        self.compact_btn.setFocusPolicy(Qt.NoFocus)
-        self.compact_btn.setAttribute(Qt.WA_Hover, True)
+        self.compact_btn = OverlayButton("─", "Compact")
         self.compact_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(0, 0, 0, 0.01);
@@ -612,16 +906,10 @@ class ClaudeUsageBar(QMainWindow):
             }
         """)
         self.compact_btn.clicked.connect(self.toggle_compact_mode)
-        self.compact_btn.setCursor(QCursor(Qt.PointingHandCursor))
         btn_layout.addWidget(self.compact_btn)
 
         # Refresh button
-        self.refresh_btn = QPushButton("⟲")
-        self.refresh_btn.setToolTip("Refresh")
-        self.refresh_btn.setFixedSize(24, 24)
-        self.refresh_btn.setAutoFillBackground(False)
-        self.refresh_btn.setFocusPolicy(Qt.NoFocus)
-        self.refresh_btn.setAttribute(Qt.WA_Hover, True)
+        self.refresh_btn = OverlayButton("⟲", "Refresh")
         self.refresh_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(0, 0, 0, 0.01);
@@ -645,16 +933,10 @@ class ClaudeUsageBar(QMainWindow):
             }
         """)
         self.refresh_btn.clicked.connect(self.manual_refresh)
-        self.refresh_btn.setCursor(QCursor(Qt.PointingHandCursor))
         btn_layout.addWidget(self.refresh_btn)
 
         # Settings button
-        self.settings_btn = QPushButton("⚙")
-        self.settings_btn.setToolTip("Settings")
-        self.settings_btn.setFixedSize(24, 24)
-        self.settings_btn.setAutoFillBackground(False)
-        self.settings_btn.setFocusPolicy(Qt.NoFocus)
-        self.settings_btn.setAttribute(Qt.WA_Hover, True)
+        self.settings_btn = OverlayButton("⚙", "Settings")
         self.settings_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(0, 0, 0, 0.01);
@@ -677,16 +959,10 @@ class ClaudeUsageBar(QMainWindow):
             }
         """)
         self.settings_btn.clicked.connect(self.show_settings)
-        self.settings_btn.setCursor(QCursor(Qt.PointingHandCursor))
         btn_layout.addWidget(self.settings_btn)
 
         # Close button
-        self.close_btn = QPushButton("×")
-        self.close_btn.setToolTip("Close")
-        self.close_btn.setFixedSize(24, 24)
-        self.close_btn.setAutoFillBackground(False)
-        self.close_btn.setFocusPolicy(Qt.NoFocus)
-        self.close_btn.setAttribute(Qt.WA_Hover, True)
+        self.close_btn = OverlayButton("×", "Close")
         self.close_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(0, 0, 0, 0.01);
@@ -710,13 +986,12 @@ class ClaudeUsageBar(QMainWindow):
             }
         """)
         self.close_btn.clicked.connect(self.on_close)
-        self.close_btn.setCursor(QCursor(Qt.PointingHandCursor))
         btn_layout.addWidget(self.close_btn)
 
     def setup_content(self, parent_layout):
         """Setup content area with progress bars"""
         self.content_frame = QFrame()
-        self.content_frame.setStyleSheet("background-color: #1a1a1a;")
+        self.content_frame.setObjectName("contentFrame")  # Labels are styled via apply_label_styles
         self.content_frame.setCursor(QCursor(Qt.ArrowCursor))
         parent_layout.addWidget(self.content_frame)
 
@@ -726,123 +1001,89 @@ class ClaudeUsageBar(QMainWindow):
         self.content_frame.setLayout(self.content_layout)
 
         # 5-Hour section
-        self.five_hour_title = QLabel("5-Hour Limit")
-        self.five_hour_title.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-        self.content_layout.addWidget(self.five_hour_title, alignment=Qt.AlignLeft)
-
-        self.five_hour_usage_label = QLabel("Loading...")
-        self.five_hour_usage_label.setStyleSheet("background: transparent; color: #cccccc; font-size: 15px;")
-        self.content_layout.addWidget(self.five_hour_usage_label, alignment=Qt.AlignLeft)
-
-        # 5-Hour progress bar (no fixed width - expands to fill available space)
-        self.five_hour_progress_bg = QFrame()
-        self.five_hour_progress_bg.setFixedHeight(12)
-        self.five_hour_progress_bg.setStyleSheet("background-color: #2a2a2a;")
-        self.content_layout.addWidget(self.five_hour_progress_bg)
-
-        progress_layout = QHBoxLayout()
-        progress_layout.setContentsMargins(0, 0, 0, 0)
-        self.five_hour_progress_bg.setLayout(progress_layout)
-
-        self.five_hour_progress_fill = QFrame()
-        self.five_hour_progress_fill.setStyleSheet(f"background-color: {self.config.get('five_hour_color', '#CC785C')}; border: none;")
-        self.five_hour_progress_fill.setFixedWidth(0)
-        progress_layout.addWidget(self.five_hour_progress_fill, alignment=Qt.AlignLeft)
-
-        # Border overlay (transparent, only shows border in clickthrough mode)
-        self.five_hour_border_overlay = QFrame(self.five_hour_progress_bg)
-        self.five_hour_border_overlay.setStyleSheet("background-color: transparent; border: none;")
-        self.five_hour_border_overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.five_hour_border_overlay.setCursor(QCursor(Qt.ArrowCursor))
-        self.five_hour_border_overlay.hide()
-
-        self.five_hour_reset_label = QLabel("Resets in: --")
-        self.five_hour_reset_label.setStyleSheet("background: transparent; color: #999999; font-size: 15px;")
-        self.content_layout.addWidget(self.five_hour_reset_label, alignment=Qt.AlignLeft)
+        (self.five_hour_title, self.five_hour_usage_label, self.five_hour_progress_bg,
+         self.five_hour_progress_fill, self.five_hour_border_overlay,
+         self.five_hour_reset_label) = self._make_section("5-Hour Limit", self._five_hour_color)
 
         # Prediction label
         self.prediction_label = QLabel("→ 100% in ~—")
-        self.prediction_label.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 11px; font-style: italic;")
+        self.prediction_label.setProperty("role", "prediction")
         if not self.config.get('show_prediction', True):
             self.prediction_label.hide()
         self.content_layout.addWidget(self.prediction_label, alignment=Qt.AlignLeft)
 
         self.spacer1 = QWidget()
         self.spacer1.setFixedHeight(10)
-        self.spacer1.setStyleSheet("background: transparent;")
         self.content_layout.addWidget(self.spacer1)
 
         # Separator
         self.separator = QFrame()
         self.separator.setFrameShape(QFrame.HLine)
-        self.separator.setStyleSheet("background: transparent; color: #333333;")
+        self.separator.setStyleSheet("color: #333333;")
         self.separator.setFixedHeight(1)
         self.content_layout.addWidget(self.separator)
 
         self.spacer2 = QWidget()
         self.spacer2.setFixedHeight(8)
-        self.spacer2.setStyleSheet("background: transparent;")
         self.content_layout.addWidget(self.spacer2)
 
         # Weekly section
-        self.weekly_title = QLabel("Weekly Limit")
-        self.weekly_title.setStyleSheet("background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-        self.content_layout.addWidget(self.weekly_title, alignment=Qt.AlignLeft)
-
-        self.weekly_usage_label = QLabel("Loading...")
-        self.weekly_usage_label.setStyleSheet("background: transparent; color: #cccccc; font-size: 15px;")
-        self.content_layout.addWidget(self.weekly_usage_label, alignment=Qt.AlignLeft)
+        (self.weekly_title, self.weekly_usage_label, self.weekly_progress_bg,
+         self.weekly_progress_fill, self.weekly_border_overlay,
+         self.weekly_reset_label) = self._make_section("Weekly Limit", self._weekly_color)
+
+    def _make_section(self, title, color):
+        """Build one usage section (title, usage text, progress bar, reset text) in the content layout"""
+        title_label = QLabel(title)
+        title_label.setProperty("role", "title")
+        self.content_layout.addWidget(title_label, alignment=Qt.AlignLeft)
+
+        usage_label = QLabel("Loading...")
+        usage_label.setProperty("role", "usage")
+        self.content_layout.addWidget(usage_label, alignment=Qt.AlignLeft)
+
+        # Progress bar (no fixed width - expands to fill available space)
+        progress_bg = QFrame()
+        progress_bg.setFixedHeight(12)
+        progress_bg.setStyleSheet("background-color: #2a2a2a;")
+        self.content_layout.addWidget(progress_bg)
 
-        # Weekly progress bar (no fixed width - expands to fill available space)
-        self.weekly_progress_bg = QFrame()
-        self.weekly_progress_bg.setFixedHeight(12)
-        self.weekly_progress_bg.setStyleSheet("background-color: #2a2a2a;")
-        self.content_layout.addWidget(self.weekly_progress_bg)
-
-        weekly_progress_layout = QHBoxLayout()
-        weekly_progress_layout.setContentsMargins(0, 0, 0, 0)
-        self.weekly_progress_bg.setLayout(weekly_progress_layout)
+        progress_layout = QHBoxLayout()
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        progress_bg.setLayout(progress_layout)
 
-        self.weekly_progress_fill = QFrame()
-        self.weekly_progress_fill.setStyleSheet(f"background-color: {self.config.get('weekly_color', '#8B6BB7')}; border: none;")
-        self.weekly_progress_fill.setFixedWidth(0)
-        weekly_progress_layout.addWidget(self.weekly_progress_fill, alignment=Qt.AlignLeft)
+        progress_fill = QFrame()
+        self._set_bar_color(progress_fill, color)
+        progress_fill.setFixedWidth(0)
+        progress_layout.addWidget(progress_fill, alignment=Qt.AlignLeft)
 
         # Border overlay (transparent, only shows border in clickthrough mode)
-        self.weekly_border_overlay = QFrame(self.weekly_progress_bg)
-        self.weekly_border_overlay.setStyleSheet("background-color: transparent; border: none;")
-        self.weekly_border_overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.weekly_border_overlay.setCursor(QCursor(Qt.ArrowCursor))
-        self.weekly_border_overlay.hide()
+        border_overlay = QFrame(progress_bg)
+        border_overlay.setStyleSheet("background-color: transparent; border: none;")
+        border_overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
+        border_overlay.setCursor(QCursor(Qt.ArrowCursor))
+        border_overlay.hide()
+
+        reset_label = QLabel("Resets in: --")
+        reset_label.setProperty("role", "reset")
+        self.content_layout.addWidget(reset_label, alignment=Qt.AlignLeft)
 
-        self.weekly_reset_label = QLabel("Resets in: --")
-        self.weekly_reset_label.setStyleSheet("background: transparent; color: #999999; font-size: 15px;")
-        self.content_layout.addWidget(self.weekly_reset_label, alignment=Qt.AlignLeft)
+        return title_label, usage_label, progress_bg, progress_fill, border_overlay, reset_label
 
     def apply_background_opacity(self):
         """Apply opacity to background elements only, keeping text/bars fully visible"""
-        opacity = self.config.get('opacity', 0.9)
-        alpha = int(opacity * 255)
-
+        # Only the outermost frame has a background - inner widgets don't paint one
         # Single background color for everything - #1a1a1a = rgb(26, 26, 26)
-        bg = f"rgba(26, 26, 26, {alpha})"
-
-        # Only apply background to outermost frame - inner frames are transparent
         # Use minimum 1% opacity so users can still drag the window at 0%
-        min_alpha = max(alpha, 3)
-        self.main_frame.setStyleSheet(f"background-color: rgba(26, 26, 26, {min_alpha});")
-        self.content_frame.setStyleSheet("background: transparent;")
-        self.header.setStyleSheet("background: transparent;")
-
-        # Apply to labels (only if not in clickthrough mode)
-        if not self.clickthrough_enabled:
-            font_size = self.config.get('font_size', 15)
-            self.five_hour_title.setStyleSheet(f"background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.five_hour_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {font_size}px;")
-            self.five_hour_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {font_size}px;")
-            self.weekly_title.setStyleSheet(f"background: transparent; color: #aaaaaa; font-size: 12px; font-weight: bold;")
-            self.weekly_usage_label.setStyleSheet(f"background: transparent; color: #cccccc; font-size: {font_size}px;")
-            self.weekly_reset_label.setStyleSheet(f"background: transparent; color: #999999; font-size: {font_size}px;")
+        min_alpha = max(self._alpha, 3)
+        if min_alpha == self._applied_alpha:
+            return  # Slider moved within the same alpha step
+        self._applied_alpha = min_alpha
+
+        self._set_style(self.main_frame, self._FRAME_BG_QSS[min_alpha])
+
+        # Labels (and the content frame) share one stylesheet
+        self.apply_label_styles()
 
         # Update floating button to match
         self.update_floating_button_style()
@@ -856,18 +1097,13 @@ class ClaudeUsageBar(QMainWindow):
     def force_topmost(self):
         """Force window to stay on top using Windows API"""
         try:
-            import ctypes
             hwnd = int(self.winId())
-            HWND_TOPMOST = -1
-            SWP_NOMOVE = 0x0002
-            SWP_NOSIZE = 0x0001
-            SWP_NOACTIVATE = 0x0010
-            ctypes.windll.user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+            SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
 
             # Also apply to floating button if visible
             if self.floating_btn and self.floating_btn.isVisible():
                 hwnd_float = int(self.floating_btn.winId())
-                ctypes.windll.user32.SetWindowPos(hwnd_float, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+                SetWindowPos(hwnd_float, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
         except Exception as e:
             pass
 
@@ -894,29 +1130,7 @@ class ClaudeUsageBar(QMainWindow):
     def update_floating_button_style(self):
         """Update floating button style to match main window background"""
         if hasattr(self, 'floating_btn_inner'):
-            opacity = self.config.get('opacity', 0.9)
-            alpha = max(int(opacity * 255), 3)
-            self.floating_btn_inner.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgba(26, 26, 26, {alpha});
-                    color: #44ff44;
-                    border: none;
-                    font-size: 10px;
-                    padding: 5px;
-                    margin: 0px;
-                    outline: none;
-                }}
-                QPushButton:hover {{
-                    background: rgba(255, 255, 255, 0.2);
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                }}
-                QPushButton:focus {{
-                    outline: none;
-                    border: none;
-                }}
-            """)
+            self._set_style(self.floating_btn_inner, self._FLOAT_BTN_QSS % max(self._alpha, 3))
 
     def update_floating_button_position(self):
         """Update floating button position to match clickthrough button"""
@@ -933,15 +1147,7 @@ class ClaudeUsageBar(QMainWindow):
             if self.clickthrough_enabled:
                 # Check if click is on any draggable element
                 widget = self.childAt(event.pos())
-                draggable_widgets = [
-                    self.title_label, self.five_hour_progress_bg, self.five_hour_progress_fill,
-                    self.five_hour_border_overlay, self.weekly_progress_bg,
-                    self.weekly_progress_fill, self.weekly_border_overlay,
-                    self.five_hour_usage_label, self.five_hour_reset_label,
-                    self.five_hour_title, self.weekly_usage_label,
-                    self.weekly_reset_label, self.weekly_title
-                ]
-                if widget in draggable_widgets:
+                if widget in self.draggable_widgets:
                     self.dragging = True
                     self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
                     event.accept()
@@ -954,11 +1160,14 @@ class ClaudeUsageBar(QMainWindow):
                     event.accept()
 
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton and self.dragging:
+        if self.dragging and event.buttons() == Qt.LeftButton:
             self.move(event.globalPos() - self.drag_position)
-            # Update floating button position while dragging
-            if self.floating_btn and self.floating_btn.isVisible():
-                self.update_floating_button_position()
+            # Update floating button position while dragging (coalesced to ~60Hz)
+            timer = self._float_move_timer
+            if not timer.isActive():
+                floating_btn = self.floating_btn
+                if floating_btn and floating_btn.isVisible():
+                    timer.start(16)
             event.accept()
 
     def mouseReleaseEvent(self, event):
@@ -968,7 +1177,8 @@ class ClaudeUsageBar(QMainWindow):
             self.config['position']['x'] = self.x()
             self.config['position']['y'] = self.y()
             self.save_config()
-            # Update floating button position
+            # Snap floating button to the final position (drops any pending coalesced move)
+            self._float_move_timer.stop()
             if self.floating_btn and self.floating_btn.isVisible():
                 self.update_floating_button_position()
             event.accept()
@@ -979,99 +1189,63 @@ class ClaudeUsageBar(QMainWindow):
 
         # Enable/disable click-through using Windows API
         try:
-            import ctypes
             hwnd = int(self.winId())
-            GWL_EXSTYLE = -20
-            WS_EX_TRANSPARENT = 0x00000020
-            WS_EX_LAYERED = 0x00080000
-
-            style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+            style = GetWindowLongW(hwnd, GWL_EXSTYLE)
             if self.clickthrough_enabled:
                 # Add transparent style (clicks pass through)
-                ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_TRANSPARENT | WS_EX_LAYERED)
+                SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_TRANSPARENT | WS_EX_LAYERED)
             else:
                 # Remove transparent style
-                ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style & ~WS_EX_TRANSPARENT)
+                SetWindowLongW(hwnd, GWL_EXSTYLE, style & ~WS_EX_TRANSPARENT)
         except Exception as e:
             print(f"Click-through toggle error: {e}")
 
-        if self.clickthrough_enabled:
-            # Change button to indicate active state
-            self.clickthrough_btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(0, 0, 0, 0.01);
-                    color: #44ff44;
-                    border: 1px solid transparent;
-                    font-size: 12px;
-                    padding: 5px;
-                    margin: 0px;
-                    outline: none;
-                }
-            """)
-            self.clickthrough_btn.setToolTip("Disable Clickthrough")
-
-            # Hide all buttons (floating button takes over)
-            self.clickthrough_btn.hide()
-            self.compact_btn.hide()
-            self.refresh_btn.hide()
-            self.settings_btn.hide()
-            self.close_btn.hide()
-
-            # Show floating button
-            if self.floating_btn:
-                self.update_floating_button_style()
+        with self._batch_style():
+            if self.clickthrough_enabled:
+                # Change button to indicate active state
+                self.clickthrough_btn.setProperty("state", "active")
+                self.clickthrough_btn.style().polish(self.clickthrough_btn)
+                self.clickthrough_btn.setToolTip("Disable Clickthrough")
+
+                # Hide all buttons (floating button takes over)
+                self.clickthrough_btn.hide()
+                self.compact_btn.hide()
+                self.refresh_btn.hide()
+                self.settings_btn.hide()
+                self.close_btn.hide()
+
+                # Show floating button
+                if self.floating_btn is None:
+                    self.create_floating_button()
+                else:
+                    self.update_floating_button_style()
                 self.update_floating_button_position()
                 self.floating_btn.show()
-        else:
-            # Restore normal button style
-            self.clickthrough_btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(0, 0, 0, 0.01);
-                    color: #aaaaaa;
-                    border: none;
-                    font-size: 14px;
-                    padding: 5px;
-                    margin: 0px;
-                    outline: none;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.2);
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 3px;
-                }
-                QPushButton:focus {
-                    outline: none;
-                    border: none;
-                }
-            """)
-            self.clickthrough_btn.setToolTip("Enable Clickthrough")
-
-            # Show all buttons
-            self.clickthrough_btn.show()
-            self.compact_btn.show()
-            self.refresh_btn.show()
-            self.settings_btn.show()
-            self.close_btn.show()
-
-            # Hide floating button
-            if self.floating_btn:
-                self.floating_btn.hide()
+            else:
+                # Restore normal button style
+                self.clickthrough_btn.setProperty("state", "idle")
+                self.clickthrough_btn.style().polish(self.clickthrough_btn)
+                self.clickthrough_btn.setToolTip("Enable Clickthrough")
+
+                # Show all buttons
+                self.clickthrough_btn.show()
+                self.compact_btn.show()
+                self.refresh_btn.show()
+                self.settings_btn.show()
+                self.close_btn.show()
+
+                # Hide floating button
+                if self.floating_btn:
+                    self.floating_btn.hide()
 
         # Update progress bar widths
-        QApplication.processEvents()
+        self._settle_layout()
         if self.usage_data:
-            five_hour = self.usage_data.get('five_hour', {})
-            five_hour_utilization = five_hour.get('utilization', 0.0)
-            max_width = self.five_hour_progress_bg.width()
-            bar_width = int((five_hour_utilization / 100) * max_width)
-            self.five_hour_progress_fill.setFixedWidth(bar_width)
+            five_hour_utilization = self.usage_data.get('five_hour', {}).get('utilization', 0.0)
+            self._set_bar_width(self.five_hour_progress_fill, self.five_hour_progress_bg, five_hour_utilization)
 
-            weekly = self.usage_data.get('seven_day', {})
-            weekly_utilization = weekly.get('utilization', 0.0)
-            weekly_max_width = self.weekly_progress_bg.width()
-            weekly_bar_width = int((weekly_utilization / 100) * weekly_max_width)
-            self.weekly_progress_fill.setFixedWidth(weekly_bar_width)
+            weekly_utilization = self.usage_data.get('seven_day', {}).get('utilization', 0.0)
+            self._set_bar_width(self.weekly_progress_fill, self.weekly_progress_bg, weekly_utilization)
 
     def toggle_compact_mode(self):
         """Toggle compact mode"""
@@ -1081,54 +1255,52 @@ class ClaudeUsageBar(QMainWindow):
 
     def apply_compact_mode(self):
         """Apply or remove compact mode"""
-        compact = self.config.get('compact_mode', False)
+        compact = self._compact
 
-        # Reset all size constraints first
-        self.setMinimumSize(0, 0)
-        self.setMaximumSize(16777215, 16777215)
+        with self._batch_style():
+            if compact:
+                # Reset size constraints so the compact size hint can shrink the window
+                self.setMinimumSize(0, 0)
+                self.setMaximumSize(16777215, 16777215)
 
-        if compact:
-            # Hide weekly, titles, and spacers (but keep five_hour_usage_label visible)
-            self.five_hour_title.hide()
-            self.five_hour_reset_label.hide()
-            self.prediction_label.hide()
-            self.spacer1.hide()
-            self.separator.hide()
-            self.spacer2.hide()
-            self.weekly_title.hide()
-            self.weekly_usage_label.hide()
-            self.weekly_progress_bg.hide()
-            self.weekly_reset_label.hide()
-            self.five_hour_usage_label.show()
-            self.compact_btn.setText("═")
-            self.compact_btn.setToolTip("Expand")
-
-            # Force layout recalculation and auto-size for compact
-            self.content_frame.updateGeometry()
-            self.main_frame.updateGeometry()
-            self.centralWidget().updateGeometry()
-            QApplication.processEvents()
-            self.adjustSize()
-            # Ensure width stays at 300
-            self.setFixedSize(300, self.height())
-        else:
-            # Show everything including spacers
-            self.five_hour_title.show()
-            self.five_hour_usage_label.show()
-            self.five_hour_reset_label.show()
-            # prediction_label shows itself when prediction data exists
-            self.spacer1.show()
-            self.separator.show()
-            self.spacer2.show()
-            self.weekly_title.show()
-            self.weekly_usage_label.show()
-            self.weekly_progress_bg.show()
-            self.weekly_reset_label.show()
-            self.compact_btn.setText("─")
-            self.compact_btn.setToolTip("Compact")
-
-            # Use stored full height for non-compact, fixed width
-            self.setFixedSize(300, self.full_height)
+                # Hide weekly, titles, and spacers (but keep five_hour_usage_label visible)
+                self.five_hour_title.hide()
+                self.five_hour_reset_label.hide()
+                self.prediction_label.hide()
+                self.spacer1.hide()
+                self.separator.hide()
+                self.spacer2.hide()
+                self.weekly_title.hide()
+                self.weekly_usage_label.hide()
+                self.weekly_progress_bg.hide()
+                self.weekly_reset_label.hide()
+                self.five_hour_usage_label.show()
+                self.compact_btn.setText("═")
+                self.compact_btn.setToolTip("Expand")
+
+                # Let the layout settle, then auto-size for compact
+                self._settle_layout()
+                # Single resize to the compact height, width stays at 300
+                self.setFixedSize(300, self.sizeHint().height())
+            else:
+                # Show everything including spacers
+                self.five_hour_title.show()
+                self.five_hour_usage_label.show()
+                self.five_hour_reset_label.show()
+                # prediction_label shows itself when prediction data exists
+                self.spacer1.show()
+                self.separator.show()
+                self.spacer2.show()
+                self.weekly_title.show()
+                self.weekly_usage_label.show()
+                self.weekly_progress_bg.show()
+                self.weekly_reset_label.show()
+                self.compact_btn.setText("─")
+                self.compact_btn.setToolTip("Compact")
+
+                # Use stored full height for non-compact, fixed width
+                # (setFixedSize replaces both constraints, no reset needed)
+                self.setFixedSize(300, self.full_height)
 
         # Trigger update
         QTimer.singleShot(0, self.update_progress)
@@ -1138,14 +1310,10 @@ class ClaudeUsageBar(QMainWindow):
         if self.clickthrough_enabled:
             return
 
-        def refresh():
-            data = self.fetch_usage_data()
-            if data:
-                self.usage_data = data
-                # Update UI in main thread
-                QTimer.singleShot(0, self.update_progress)
-
-        threading.Thread(target=refresh, daemon=True).start()
+        # Same worker and result signal as polling; the next poll is re-armed when this one lands
+        # (repeated clicks, or a click during a scheduled poll, are dropped by _submit_fetch)
+        if self._submit_fetch():
+            self._poll_timer.stop()
 
     def show_settings_from_tray(self):
         """Show settings from tray - bypass clickthrough check"""
@@ -1163,6 +1331,16 @@ class ClaudeUsageBar(QMainWindow):
             self.settings_window.activateWindow()
             return
 
+        if self.settings_window is None:
+            self._build_settings_window()
+        else:
+            # The session key can change outside the dialog (sign-in, auto refresh)
+            if 'session_key' in self.settings_widgets:
+                self.settings_widgets['session_key'].setText(self.config.get('session_key', '') or '')
+        self.settings_window.show()
+
+    def _build_settings_window(self):
+        """Build the settings dialog (once; closing it only hides it)"""
         self.settings_window = QDialog(self)
         self.settings_window.setWindowTitle("Settings")
         self.settings_window.setWindowFlags(self.settings_window.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -1181,11 +1359,12 @@ class ClaudeUsageBar(QMainWindow):
             y = (screen.height() - 750) // 2
             self.settings_window.move(x, y)
 
-        # Save position when closed
+        # Save position when closed, and write out any pending changes right away
         def save_settings_position():
             pos = self.settings_window.pos()
             self.config['settings_position'] = {'x': pos.x(), 'y': pos.y()}
             self.save_config()
+            self._flush_config()
         self.settings_window.finished.connect(save_settings_position)
 
         layout = QVBoxLayout()
@@ -1281,8 +1460,8 @@ class ClaudeUsageBar(QMainWindow):
         def on_opacity_change(v):
             opacity_label.setText(f"Window Opacity: {v}%")
             self.config['opacity'] = v / 100
-            self.apply_background_opacity()
             self.save_config()
+            self.apply_background_opacity()
             # Enable text background only when opacity is 0
             if 'checkbox' in text_bg_ref:
                 text_bg_ref['checkbox'].setEnabled(v == 0)
@@ -1330,11 +1509,7 @@ class ClaudeUsageBar(QMainWindow):
         text_bg_opacity_slider.setRange(0, 100)
         text_bg_opacity_slider.setValue(self.config.get('text_background_opacity', 70))
         text_bg_opacity_slider.setEnabled(current_opacity == 0 and self.config.get('text_background', False))
-        text_bg_opacity_slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }
-            QSlider::handle:horizontal:disabled { background: #666; }
-        """)
+        text_bg_opacity_slider.setStyleSheet(self._SLIDER_QSS + "QSlider::handle:horizontal:disabled { background: #666; }")
         text_bg_opacity_layout.addWidget(text_bg_opacity_slider)
 
         text_bg_opacity_value = QLabel(f"{self.config.get('text_background_opacity', 70)}%")
@@ -1387,10 +1562,7 @@ class ClaudeUsageBar(QMainWindow):
         font_size_slider = QSlider(Qt.Horizontal)
         font_size_slider.setRange(10, 24)
         font_size_slider.setValue(self.config.get('font_size', 15))
-        font_size_slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }
-        """)
+        font_size_slider.setStyleSheet(self._SLIDER_QSS)
         font_size_layout.addWidget(font_size_slider)
 
         font_size_value = QLabel(f"{self.config.get('font_size', 15)}px")
@@ -1414,10 +1586,7 @@ class ClaudeUsageBar(QMainWindow):
         bar_height_slider = QSlider(Qt.Horizontal)
         bar_height_slider.setRange(4, 24)
         bar_height_slider.setValue(self.config.get('progress_bar_height', 12))
-        bar_height_slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }
-        """)
+        bar_height_slider.setStyleSheet(self._SLIDER_QSS)
         bar_height_layout.addWidget(bar_height_slider)
 
         bar_height_value = QLabel(f"{self.config.get('progress_bar_height', 12)}px")
@@ -1432,123 +1601,125 @@ class ClaudeUsageBar(QMainWindow):
         bar_height_slider.valueChanged.connect(on_bar_height_change)
         scroll_layout.addLayout(bar_height_layout)
 
-        # --- Notifications Section ---
-        notif_header = QLabel("Notifications")
-        notif_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
-        scroll_layout.addWidget(notif_header)
-
-        # Enable notifications checkbox
-        notif_enabled_check = QCheckBox("Enable usage notifications")
-        notif_enabled_check.setStyleSheet(checkbox_style)
-        notif_enabled_check.setChecked(self.config.get('notifications_enabled', True))
-        scroll_layout.addWidget(notif_enabled_check)
-
-        # Sound alerts checkbox
-        sound_check = QCheckBox("Play sound with notifications")
-        sound_check.setStyleSheet(checkbox_style)
-        sound_check.setChecked(self.config.get('sound_alerts', False))
-        def on_sound_change(state):
-            self.config['sound_alerts'] = bool(state)
-            self.save_config()
-        sound_check.stateChanged.connect(on_sound_change)
-        scroll_layout.addWidget(sound_check)
-
-        # Sound type selection
-        sound_layout = QHBoxLayout()
-        sound_type_label = QLabel("Sound:")
-        sound_type_label.setStyleSheet("color: #cccccc;")
-        sound_layout.addWidget(sound_type_label)
-
-        from PyQt5.QtWidgets import QComboBox, QFileDialog
-        sound_combo = QComboBox()
-        sound_combo.setStyleSheet("background: #2a2a2a; color: white; padding: 5px;")
-        sound_combo.addItems(["Exclamation", "Hand", "Beep Low", "Beep High", "Double Beep", "Custom"])
-        current_sound = self.config.get('sound_type', 'Exclamation')
-        sound_combo.setCurrentText(current_sound)
-
-        # Browse button for custom sound
-        browse_btn = QPushButton("Browse")
-        browse_btn.setStyleSheet("background: #444; color: white; padding: 5px 10px;")
-        browse_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        browse_btn.setVisible(current_sound == "Custom")
-
-        def on_sound_type_change(text):
-            self.config['sound_type'] = text
-            self.save_config()
-            browse_btn.setVisible(text == "Custom")
-        sound_combo.currentTextChanged.connect(on_sound_type_change)
-        sound_layout.addWidget(sound_combo)
-
-        def browse_sound():
-            file_path, _ = QFileDialog.getOpenFileName(
-                self.settings_window,
-                "Select Sound File",
-                "",
-                "Sound Files (*.wav *.mp3);;All Files (*)"
-            )
-            if file_path:
-                self.config['custom_sound_path'] = file_path
+        # Sections below the fold are built on the next event loop pass, so the
+        # dialog paints System and Appearance first instead of every widget at once
+        def build_lower_sections():
+            # --- Notifications Section ---
+            notif_header = QLabel("Notifications")
+            notif_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
+            scroll_layout.addWidget(notif_header)
+
+            # Enable notifications checkbox
+            notif_enabled_check = QCheckBox("Enable usage notifications")
+            notif_enabled_check.setStyleSheet(checkbox_style)
+            notif_enabled_check.setChecked(self.config.get('notifications_enabled', True))
+            scroll_layout.addWidget(notif_enabled_check)
+
+            # Sound alerts checkbox
+            sound_check = QCheckBox("Play sound with notifications")
+            sound_check.setStyleSheet(checkbox_style)
+            sound_check.setChecked(self.config.get('sound_alerts', False))
+            def on_sound_change(state):
+                self.config['sound_alerts'] = bool(state)
+                self.save_config()
+            sound_check.stateChanged.connect(on_sound_change)
+            scroll_layout.addWidget(sound_check)
+
+            # Sound type selection
+            sound_layout = QHBoxLayout()
+            sound_type_label = QLabel("Sound:")
+            sound_type_label.setStyleSheet("color: #cccccc;")
+            sound_layout.addWidget(sound_type_label)
+
+            from PyQt5.QtWidgets import QComboBox, QFileDialog
+            sound_combo = QComboBox()
+            sound_combo.setStyleSheet("background: #2a2a2a; color: white; padding: 5px;")
+            sound_combo.addItems(["Exclamation", "Hand", "Beep Low", "Beep High", "Double Beep", "Custom"])
+            current_sound = self.config.get('sound_type', 'Exclamation')
+            sound_combo.setCurrentText(current_sound)
+
+            # Browse button for custom sound
+            browse_btn = QPushButton("Browse")
+            browse_btn.setStyleSheet("background: #444; color: white; padding: 5px 10px;")
+            browse_btn.setCursor(QCursor(Qt.PointingHandCursor))
+            browse_btn.setVisible(current_sound == "Custom")
+
+            def on_sound_type_change(text):
+                self.config['sound_type'] = text
                 self.save_config()
-        browse_btn.clicked.connect(browse_sound)
-        sound_layout.addWidget(browse_btn)
+                browse_btn.setVisible(text == "Custom")
+                if text != "Custom":
+                    self._close_mci()
+            sound_combo.currentTextChanged.connect(on_sound_type_change)
+            sound_layout.addWidget(sound_combo)
+
+            def browse_sound():
+                # Start in the folder last picked from rather than listing the home folder each time
+                start_dir = self.config.get('last_sound_dir') or os.path.dirname(self.config.get('custom_sound_path', ''))
+                file_path, _ = QFileDialog.getOpenFileName(
+                    self.settings_window,
+                    "Select Sound File",
+                    start_dir,
+                    "Sound Files (*.wav *.mp3);;All Files (*)",
+                    options=QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+                )
+                if file_path:
+                    if file_path != self.config.get('custom_sound_path'):
+                        self._close_mci()  # The open alias still holds the old file
+                    self.config['custom_sound_path'] = file_path
+                    self.config['last_sound_dir'] = os.path.dirname(file_path)
+                    self.save_config()
+            browse_btn.clicked.connect(browse_sound)
+            sound_layout.addWidget(browse_btn)
+
+            test_sound_btn = QPushButton("Test")
+            test_sound_btn.setStyleSheet("background: #444; color: white; padding: 5px 10px;")
+            test_sound_btn.setCursor(QCursor(Qt.PointingHandCursor))
+            def test_sound():
+                self.play_alert_sound()
+            test_sound_btn.clicked.connect(test_sound)
+            sound_layout.addWidget(test_sound_btn)
+            scroll_layout.addLayout(sound_layout)
+
+            # Volume slider
+            volume_layout = QHBoxLayout()
+            volume_label = QLabel("Volume:")
+            volume_label.setStyleSheet("color: #cccccc;")
+            volume_layout.addWidget(volume_label)
+
+            volume_slider = QSlider(Qt.Horizontal)
+            volume_slider.setRange(0, 100)
+            volume_slider.setValue(self.config.get('sound_volume', 100))
+            volume_slider.setStyleSheet(self._SLIDER_QSS)
+            volume_layout.addWidget(volume_slider)
+
+            volume_value = QLabel(f"{self.config.get('sound_volume', 100)}%")
+            volume_value.setStyleSheet("color: #cccccc; min-width: 40px;")
+            volume_layout.addWidget(volume_value)
+
+            def on_volume_change(value):
+                self.config['sound_volume'] = value
+                volume_value.setText(f"{value}%")
+                self.save_config()
+            volume_slider.valueChanged.connect(on_volume_change)
+            scroll_layout.addLayout(volume_layout)
 
-        test_sound_btn = QPushButton("Test")
-        test_sound_btn.setStyleSheet("background: #444; color: white; padding: 5px 10px;")
-        test_sound_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        def test_sound():
-            self.play_alert_sound()
-        test_sound_btn.clicked.connect(test_sound)
-        sound_layout.addWidget(test_sound_btn)
-        scroll_layout.addLayout(sound_layout)
-
-        # Volume slider
-        volume_layout = QHBoxLayout()
-        volume_label = QLabel("Volume:")
-        volume_label.setStyleSheet("color: #cccccc;")
-        volume_layout.addWidget(volume_label)
-
-        volume_slider = QSlider(Qt.Horizontal)
-        volume_slider.setRange(0, 100)
-        volume_slider.setValue(self.config.get('sound_volume', 100))
-        volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }
-            QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }
-        """)
-        volume_layout.addWidget(volume_slider)
+            # Threshold list
+            thresholds_label = QLabel("Alert thresholds:")
+            thresholds_label.setStyleSheet("color: #cccccc;")
+            scroll_layout.addWidget(thresholds_label)
 
-        volume_value = QLabel(f"{self.config.get('sound_volume', 100)}%")
-        volume_value.setStyleSheet("color: #cccccc; min-width: 40px;")
-        volume_layout.addWidget(volume_value)
+            # Container for threshold items
+            thresholds_container = QWidget()
+            thresholds_layout = QVBoxLayout()
+            thresholds_layout.setContentsMargins(0, 0, 0, 0)
+            thresholds_layout.setSpacing(8)
+            thresholds_container.setLayout(thresholds_layout)
 
-        def on_volume_change(value):
-            self.config['sound_volume'] = value
-            volume_value.setText(f"{value}%")
-            self.save_config()
-        volume_slider.valueChanged.connect(on_volume_change)
-        scroll_layout.addLayout(volume_layout)
-
-        # Threshold list
-        thresholds_label = QLabel("Alert thresholds:")
-        thresholds_label.setStyleSheet("color: #cccccc;")
-        scroll_layout.addWidget(thresholds_label)
-
-        # Container for threshold items
-        thresholds_container = QWidget()
-        thresholds_layout = QVBoxLayout()
-        thresholds_layout.setContentsMargins(0, 0, 0, 0)
-        thresholds_layout.setSpacing(8)
-        thresholds_container.setLayout(thresholds_layout)
-
-        def refresh_thresholds():
-            # Clear existing
-            while thresholds_layout.count():
-                item = thresholds_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            # Add current thresholds as sliders
-            thresholds = self.config.get('notification_thresholds', [70, 90])
-            for i, threshold in enumerate(thresholds):
+            # One row layout per threshold, kept in the same order as the config list
+            self._threshold_rows = []
+
+            def add_threshold_row(threshold):
                 row = QHBoxLayout()
                 row.setSpacing(8)
 
@@ -1556,10 +1727,7 @@ class ClaudeUsageBar(QMainWindow):
                 slider = QSlider(Qt.Horizontal)
                 slider.setRange(1, 100)
                 slider.setValue(threshold)
-                slider.setStyleSheet("""
-                    QSlider::groove:horizontal { background: #333; height: 6px; border-radius: 3px; }
-                    QSlider::handle:horizontal { background: #CC785C; width: 14px; margin: -4px 0; border-radius: 7px; }
-                """)
+                slider.setStyleSheet(self._SLIDER_QSS)
                 row.addWidget(slider)
 
                 # Value label
@@ -1567,356 +1735,386 @@ class ClaudeUsageBar(QMainWindow):
                 value_label.setStyleSheet("color: #cccccc; min-width: 40px;")
                 row.addWidget(value_label)
 
-                # Update function for this slider
-                def make_update_func(idx, lbl):
-                    def update(val):
-                        lbl.setText(f"{val}%")
-                        thresholds = self.config.get('notification_thresholds', [70, 90])
-                        old_val = thresholds[idx]
-                        thresholds[idx] = val
-                        self.config['notification_thresholds'] = thresholds
-                        self.save_config()
-                        # Update notified thresholds tracking
-                        self.notified_thresholds.discard(f"5-hour_{old_val}")
-                        self.notified_thresholds.discard(f"weekly_{old_val}")
-                    return update
-                slider.valueChanged.connect(make_update_func(i, value_label))
+                # One shared handler for all rows, it finds its label and row from the slider
+                slider.setProperty('value_label', value_label)
+                slider.setProperty('row', row)
+                slider.valueChanged.connect(self._on_threshold_slider)
 
                 # Remove button
                 remove_btn = QPushButton("×")
                 remove_btn.setFixedSize(20, 20)
                 remove_btn.setStyleSheet("background: #ff4444; color: white; border: none; border-radius: 3px;")
                 remove_btn.setCursor(QCursor(Qt.PointingHandCursor))
-                remove_btn.clicked.connect(lambda checked, idx=i: remove_threshold(idx))
+                remove_btn.clicked.connect(lambda: remove_threshold(row))
                 row.addWidget(remove_btn)
 
-                row_widget = QWidget()
-                row_widget.setLayout(row)
-                thresholds_layout.addWidget(row_widget)
+                thresholds_layout.addLayout(row)
+                self._threshold_rows.append(row)
 
-        def remove_threshold(idx):
-            thresholds = self.config.get('notification_thresholds', [70, 90])
-            if 0 <= idx < len(thresholds):
+            def remove_threshold(row):
+                idx = self._threshold_rows.index(row)
+                thresholds = self.config.get('notification_thresholds', [70, 90])
                 old_val = thresholds.pop(idx)
                 self.config['notification_thresholds'] = thresholds
                 self.save_config()
-                self.notified_thresholds.discard(f"5-hour_{old_val}")
-                self.notified_thresholds.discard(f"weekly_{old_val}")
-                refresh_thresholds()
-
-        refresh_thresholds()
-        scroll_layout.addWidget(thresholds_container)
-
-        # Add new threshold button
-        add_btn = QPushButton("+ Add Alert")
-        add_btn.setStyleSheet("background: #CC785C; color: white; border: none; padding: 8px 15px; border-radius: 3px;")
-        add_btn.setCursor(QCursor(Qt.PointingHandCursor))
-        def add_threshold():
-            thresholds = self.config.get('notification_thresholds', [70, 90])
-            # Find a value not already used
-            new_val = 50
-            while new_val in thresholds and new_val <= 100:
-                new_val += 5
-            if new_val > 100:
-                new_val = 1
-                while new_val in thresholds and new_val <= 100:
-                    new_val += 1
-            if new_val <= 100:
-                thresholds.append(new_val)
-                self.config['notification_thresholds'] = thresholds
-                self.save_config()
-                refresh_thresholds()
-        add_btn.clicked.connect(add_threshold)
-        scroll_layout.addWidget(add_btn)
+                self._forget_threshold_alerts(old_val)
+                # Only this row goes away, the others keep their widgets
+                del self._threshold_rows[idx]
+                while row.count():
+                    row.takeAt(0).widget().deleteLater()
+                thresholds_layout.removeItem(row)
+                row.deleteLater()
+
+            for threshold in self.config.get('notification_thresholds', [70, 90]):
+                add_threshold_row(threshold)
+            scroll_layout.addWidget(thresholds_container)
+
+            # Add new threshold button
+            add_btn = QPushButton("+ Add Alert")
+            add_btn.setStyleSheet("background: #CC785C; color: white; border: none; padding: 8px 15px; border-radius: 3px;")
+            add_btn.setCursor(QCursor(Qt.PointingHandCursor))
+            def add_threshold():
+                thresholds = self.config.get('notification_thresholds', [70, 90])
+                # Find a value not already used: 50, 55, ... 100 first, then any 1-100
+                used = set(thresholds)
+                new_val = next((v for v in self._THRESHOLD_CANDIDATES if v not in used), None)
+                if new_val is not None:
+                    thresholds.append(new_val)
+                    self.config['notification_thresholds'] = thresholds
+                    self.save_config()
+                    add_threshold_row(new_val)
+            add_btn.clicked.connect(add_threshold)
+            scroll_layout.addWidget(add_btn)
 
-        # Toggle visibility based on notifications enabled
-        def update_notif_visibility(state):
-            self.config['notifications_enabled'] = bool(state)
-            self.save_config()
-            thresholds_label.setVisible(bool(state))
-            thresholds_container.setVisible(bool(state))
-            add_btn.setVisible(bool(state))
-
-        notif_enabled_check.stateChanged.connect(update_notif_visibility)
-        # Set initial visibility
-        notif_enabled = self.config.get('notifications_enabled', True)
-        thresholds_label.setVisible(notif_enabled)
-        thresholds_container.setVisible(notif_enabled)
-        add_btn.setVisible(notif_enabled)
-
-        # --- Colors Section ---
-        colors_header = QLabel("Colors")
-        colors_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
-        scroll_layout.addWidget(colors_header)
-
-        # Color picker helper
-        def get_text_color(bg_color):
-            """Return black or white text depending on background luminance"""
-            c = QColor(bg_color)
-            luminance = (0.299 * c.red() + 0.587 * c.green() + 0.114 * c.blue()) / 255
-            return "black" if luminance > 0.5 else "white"
-
-        def create_color_btn(config_key, label_text, default_color):
-            current = self.config.get(config_key, default_color)
-            text_color = get_text_color(current)
-            btn = QPushButton(f"{label_text}: {current}")
-            btn.setStyleSheet(f"background-color: {current}; color: {text_color}; padding: 8px;")
-            def pick():
+            # Toggle visibility based on notifications enabled
+            def update_notif_visibility(state):
+                self.config['notifications_enabled'] = bool(state)
+                self.save_config()
+                thresholds_label.setVisible(bool(state))
+                thresholds_container.setVisible(bool(state))
+                add_btn.setVisible(bool(state))
+
+            notif_enabled_check.stateChanged.connect(update_notif_visibility)
+            # Set initial visibility
+            notif_enabled = self.config.get('notifications_enabled', True)
+            thresholds_label.setVisible(notif_enabled)
+            thresholds_container.setVisible(notif_enabled)
+            add_btn.setVisible(notif_enabled)
+
+            # --- Colors Section ---
+            colors_header = QLabel("Colors")
+            colors_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
+            scroll_layout.addWidget(colors_header)
+
+            # Color picker helper
+            def get_text_color(bg_color):
+                """Return black or white text depending on background luminance"""
                 try:
-                    dialog = QColorDialog(QColor(self.config.get(config_key, default_color)), self.settings_window)
-                    dialog.setOption(QColorDialog.DontUseNativeDialog, True)
-                    dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-                    self.apply_dark_titlebar(dialog)
-                    dialog.setStyleSheet("""
-                        * { background-color: #1a1a1a; color: white; }
-                        QLineEdit { background-color: #333; border: 1px solid #555; }
-                        QSpinBox { background-color: #333; }
-                    """)
-                    # Style all buttons directly
-                    for dialog_btn in dialog.findChildren(QPushButton):
-                        dialog_btn.setStyleSheet("background-color: #444; color: white; border: 1px solid #555; padding: 5px 15px;")
-                    dialog.exec_()
-                    color = dialog.currentColor()
-                    if color.isValid():
-                        text_col = get_text_color(color.name())
-                        btn.setText(f"{label_text}: {color.name()}")
-                        btn.setStyleSheet(f"background-color: {color.name()}; color: {text_col}; padding: 8px;")
-                        btn.setProperty('color_value', color.name())
-                        self.config[config_key] = color.name()
-                        # Apply color changes immediately
-                        if config_key == 'five_hour_color':
-                            self.five_hour_progress_fill.setStyleSheet(f"background-color: {color.name()}; border: none;")
-                        elif config_key == 'weekly_color':
-                            self.weekly_progress_fill.setStyleSheet(f"background-color: {color.name()}; border: none;")
-                        elif config_key == 'border_color':
-                            self.apply_border()
-                        self.save_config()
-                except Exception as e:
-                    print(f"Color picker error: {e}")
-            btn.clicked.connect(pick)
-            btn.setProperty('color_value', current)
-            return btn
-
-        five_hour_btn = create_color_btn('five_hour_color', '5-Hour Bar', '#CC785C')
-        scroll_layout.addWidget(five_hour_btn)
-        self.settings_widgets['five_hour_color'] = five_hour_btn
-
-        weekly_btn = create_color_btn('weekly_color', 'Weekly Bar', '#8B6BB7')
-        scroll_layout.addWidget(weekly_btn)
-        self.settings_widgets['weekly_color'] = weekly_btn
-
-        border_btn = create_color_btn('border_color', 'Border Color', '#FFFFFF')
-        scroll_layout.addWidget(border_btn)
-        self.settings_widgets['border_color'] = border_btn
-
-        # Warning colors (70% and 90%)
-        warning_colors_label = QLabel("Warning Colors (for dynamic bar):")
-        warning_colors_label.setStyleSheet("color: #aaaaaa; font-size: 11px; margin-top: 5px;")
-        scroll_layout.addWidget(warning_colors_label)
-
-        warning_70_btn = create_color_btn('warning_color_70', '70% Warning', '#ffaa44')
-        scroll_layout.addWidget(warning_70_btn)
-
-        warning_90_btn = create_color_btn('warning_color_90', '90% Warning', '#ff4444')
-        scroll_layout.addWidget(warning_90_btn)
-
-        # --- Behavior Section ---
-        behavior_header = QLabel("Behavior")
-        behavior_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
-        scroll_layout.addWidget(behavior_header)
-
-        # Poll interval
-        poll_label = QLabel("Update Interval (seconds)")
-        poll_label.setStyleSheet(label_style)
-        scroll_layout.addWidget(poll_label)
-
-        poll_spin = QSpinBox()
-        poll_spin.setStyleSheet(input_style)
-        poll_spin.setMinimum(10)
-        poll_spin.setMaximum(300)
-        poll_spin.setValue(self.config['poll_interval'])
-        def on_poll_change(v):
-            self.config['poll_interval'] = v
-            self.save_config()
-        poll_spin.valueChanged.connect(on_poll_change)
-        scroll_layout.addWidget(poll_spin)
-        self.settings_widgets['poll_interval'] = poll_spin
-
-        # Minimize to tray
-        tray_check = QCheckBox("Minimize to System Tray")
-        tray_check.setStyleSheet(checkbox_style)
-        tray_check.setChecked(self.config.get('minimize_to_tray', False))
-        tray_check.setEnabled(TRAY_AVAILABLE)
-        if not TRAY_AVAILABLE:
-            tray_check.setText("Minimize to System Tray (pystray not installed)")
-        def on_tray_change(state):
-            self.config['minimize_to_tray'] = bool(state)
-            self.save_config()
-        tray_check.stateChanged.connect(on_tray_change)
-        scroll_layout.addWidget(tray_check)
-        self.settings_widgets['minimize_to_tray'] = tray_check
-
-        # Auto refresh session
-        auto_refresh_check = QCheckBox("Auto Refresh Session")
-        auto_refresh_check.setStyleSheet(checkbox_style)
-        auto_refresh_check.setChecked(self.config.get('auto_refresh_session', False))
-        def on_auto_refresh_change(state):
-            self.config['auto_refresh_session'] = bool(state)
-            self.save_config()
-        auto_refresh_check.stateChanged.connect(on_auto_refresh_change)
-        scroll_layout.addWidget(auto_refresh_check)
-        self.settings_widgets['auto_refresh_session'] = auto_refresh_check
+                    v = int(bg_color.lstrip('#')[:6], 16)  # Colors are normally stored as #rrggbb
+                    r, g, b = (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+                except ValueError:
+                    # Named colors ("red") from a hand-edited config, which stylesheets also accept
+                    r, g, b, _ = QColor(bg_color).getRgb()
+                # Integer form of 0.299r + 0.587g + 0.114b > 0.5 * 255
+                return "black" if 299 * r + 587 * g + 114 * b > 127500 else "white"
+
+            def create_color_btn(config_key, label_text, default_color):
+                current = self.config.get(config_key, default_color)
+                text_color = get_text_color(current)
+                btn = QPushButton(f"{label_text}: {current}")
+                btn.setStyleSheet(self._COLOR_BTN_QSS % (current, text_color))
+                dialog_ref = {}  # Dialog is built on first pick and reused after that
+                def pick():
+                    try:
+                        dialog = dialog_ref.get('dialog')
+                        if dialog is None:
+                            dialog = QColorDialog(self.settings_window)
+                            dialog.setOption(QColorDialog.DontUseNativeDialog, True)
+                            dialog.setWindowFlags(dialog.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+                            self.apply_dark_titlebar(dialog)
+                            dialog.setStyleSheet("""
+                                * { background-color: #1a1a1a; color: white; }
+                                QLineEdit { background-color: #333; border: 1px solid #555; }
+                                QSpinBox { background-color: #333; }
+                                QPushButton { background-color: #444; color: white; border: 1px solid #555; padding: 5px 15px; }
+                            """)
+                            dialog_ref['dialog'] = dialog
+                        dialog.setCurrentColor(QColor(self.config.get(config_key, default_color)))
+                        dialog.exec_()
+                        color = dialog.currentColor()
+                        name = color.name()
+                        # Picking the color already in use leaves the button, bars and config alone
+                        if color.isValid() and name != self.config.get(config_key, default_color):
+                            btn.setText(f"{label_text}: {name}")
+                            btn.setStyleSheet(self._COLOR_BTN_QSS % (name, get_text_color(name)))
+                            btn.setProperty('color_value', name)
+                            self.config[config_key] = name
+                            # Apply color changes immediately
+                            if config_key == 'five_hour_color':
+                                self._set_bar_color(self.five_hour_progress_fill, name)
+                            elif config_key == 'weekly_color':
+                                self._set_bar_color(self.weekly_progress_fill, name)
+                            elif config_key == 'border_color':
+                                self.apply_border()
+                            self.save_config()
+                    except Exception as e:
+                        print(f"Color picker error: {e}")
+                btn.clicked.connect(pick)
+                btn.setProperty('color_value', current)
+                return btn
+
+            five_hour_btn = create_color_btn('five_hour_color', '5-Hour Bar', '#CC785C')
+            scroll_layout.addWidget(five_hour_btn)
+            self.settings_widgets['five_hour_color'] = five_hour_btn
+
+            weekly_btn = create_color_btn('weekly_color', 'Weekly Bar', '#8B6BB7')
+            scroll_layout.addWidget(weekly_btn)
+            self.settings_widgets['weekly_color'] = weekly_btn
+
+            border_btn = create_color_btn('border_color', 'Border Color', '#FFFFFF')
+            scroll_layout.addWidget(border_btn)
+            self.settings_widgets['border_color'] = border_btn
+
+            # Warning colors (70% and 90%)
+            warning_colors_label = QLabel("Warning Colors (for dynamic bar):")
+            warning_colors_label.setStyleSheet("color: #aaaaaa; font-size: 11px; margin-top: 5px;")
+            scroll_layout.addWidget(warning_colors_label)
+
+            warning_70_btn = create_color_btn('warning_color_70', '70% Warning', '#ffaa44')
+            scroll_layout.addWidget(warning_70_btn)
+
+            warning_90_btn = create_color_btn('warning_color_90', '90% Warning', '#ff4444')
+            scroll_layout.addWidget(warning_90_btn)
+
+            # --- Behavior Section ---
+            behavior_header = QLabel("Behavior")
+            behavior_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
+            scroll_layout.addWidget(behavior_header)
+
+            # Poll interval
+            poll_label = QLabel("Update Interval (seconds)")
+            poll_label.setStyleSheet(label_style)
+            scroll_layout.addWidget(poll_label)
+
+            poll_spin = QSpinBox()
+            poll_spin.setStyleSheet(input_style)
+            poll_spin.setMinimum(10)
+            poll_spin.setMaximum(300)
+            poll_spin.setValue(self.config['poll_interval'])
+            def on_poll_change(v):
+                self.config['poll_interval'] = v
+                self.save_config()
+            poll_spin.valueChanged.connect(on_poll_change)
+            scroll_layout.addWidget(poll_spin)
+            self.settings_widgets['poll_interval'] = poll_spin
+
+            # Minimize to tray
+            tray_check = QCheckBox("Minimize to System Tray")
+            tray_check.setStyleSheet(checkbox_style)
+            tray_check.setChecked(self.config.get('minimize_to_tray', False))
+            tray_check.setEnabled(TRAY_AVAILABLE)
+            if not TRAY_AVAILABLE:
+                tray_check.setText("Minimize to System Tray (pystray not installed)")
+            def on_tray_change(state):
+                self.config['minimize_to_tray'] = bool(state)
+                self.save_config()
+            tray_check.stateChanged.connect(on_tray_change)
+            scroll_layout.addWidget(tray_check)
+            self.settings_widgets['minimize_to_tray'] = tray_check
+
+            # Auto refresh session
+            auto_refresh_check = QCheckBox("Auto Refresh Session")
+            auto_refresh_check.setStyleSheet(checkbox_style)
+            auto_refresh_check.setChecked(self.config.get('auto_refresh_session', False))
+            def on_auto_refresh_change(state):
+                self.config['auto_refresh_session'] = bool(state)
+                self.save_config()
+            auto_refresh_check.stateChanged.connect(on_auto_refresh_change)
+            scroll_layout.addWidget(auto_refresh_check)
+            self.settings_widgets['auto_refresh_session'] = auto_refresh_check
+
+            # --- Hotkeys Section ---
+            hotkeys_header = QLabel("Global Hotkeys")
+            hotkeys_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
+            scroll_layout.addWidget(hotkeys_header)
+
+            if not KEYBOARD_AVAILABLE:
+                hotkey_warning = QLabel("Install 'keyboard' module: pip install keyboard")
+                hotkey_warning.setStyleSheet("color: #ffaa44; font-size: 11px;")
+                scroll_layout.addWidget(hotkey_warning)
+            else:
+                hotkey_info = QLabel("Click input and press keys (Esc/Backspace to clear)")
+                hotkey_info.setStyleSheet("color: #777777; font-size: 11px;")
+                scroll_layout.addWidget(hotkey_info)
+
+            # Clickthrough hotkey
+            hk_click_layout = QHBoxLayout()
+            hk_click_layout.addStretch()
+            hk_click_label = QLabel("Clickthrough:")
+            hk_click_label.setStyleSheet("color: #cccccc;")
+            hk_click_label.setFixedWidth(70)
+            hk_click_layout.addWidget(hk_click_label)
+            hk_click_input = HotkeyEdit()
+            hk_click_input.setStyleSheet(input_style)
+            hk_click_input.setFixedWidth(80)
+            hk_click_input.setText(self.config.get('hotkey_clickthrough', 'ctrl+alt+c'))
+            hk_click_input.setEnabled(KEYBOARD_AVAILABLE)
+            def on_hk_click_change():
+                new = hk_click_input.text().strip()
+                if self.config.get('hotkey_clickthrough') == new:
+                    return
+                self.config['hotkey_clickthrough'] = new
+                self.save_config()
+                if KEYBOARD_AVAILABLE:
+                    self._hotkey_timer.start(500)
+            hk_click_input.textChanged.connect(on_hk_click_change)
+            hk_click_layout.addWidget(hk_click_input)
+            hk_click_layout.addStretch()
+            scroll_layout.addLayout(hk_click_layout)
+
+            # Compact hotkey
+            hk_compact_layout = QHBoxLayout()
+            hk_compact_layout.addStretch()
+            hk_compact_label = QLabel("Compact:")
+            hk_compact_label.setStyleSheet("color: #cccccc;")
+            hk_compact_label.setFixedWidth(70)
+            hk_compact_layout.addWidget(hk_compact_label)
+            hk_compact_input = HotkeyEdit()
+            hk_compact_input.setStyleSheet(input_style)
+            hk_compact_input.setFixedWidth(80)
+            hk_compact_input.setText(self.config.get('hotkey_compact', 'ctrl+alt+m'))
+            hk_compact_input.setEnabled(KEYBOARD_AVAILABLE)
+            def on_hk_compact_change():
+                new = hk_compact_input.text().strip()
+                if self.config.get('hotkey_compact') == new:
+                    return
+                self.config['hotkey_compact'] = new
+                self.save_config()
+                if KEYBOARD_AVAILABLE:
+                    self._hotkey_timer.start(500)
+            hk_compact_input.textChanged.connect(on_hk_compact_change)
+            hk_compact_layout.addWidget(hk_compact_input)
+            hk_compact_layout.addStretch()
+            scroll_layout.addLayout(hk_compact_layout)
+
+            # Refresh hotkey
+            hk_refresh_layout = QHBoxLayout()
+            hk_refresh_layout.addStretch()
+            hk_refresh_label = QLabel("Refresh:")
+            hk_refresh_label.setStyleSheet("color: #cccccc;")
+            hk_refresh_label.setFixedWidth(70)
+            hk_refresh_layout.addWidget(hk_refresh_label)
+            hk_refresh_input = HotkeyEdit()
+            hk_refresh_input.setStyleSheet(input_style)
+            hk_refresh_input.setFixedWidth(80)
+            hk_refresh_input.setText(self.config.get('hotkey_refresh', 'ctrl+alt+r'))
+            hk_refresh_input.setEnabled(KEYBOARD_AVAILABLE)
+            def on_hk_refresh_change():
+                new = hk_refresh_input.text().strip()
+                if self.config.get('hotkey_refresh') == new:
+                    return
+                self.config['hotkey_refresh'] = new
+                self.save_config()
+                if KEYBOARD_AVAILABLE:
+                    self._hotkey_timer.start(500)
+            hk_refresh_input.textChanged.connect(on_hk_refresh_change)
+            hk_refresh_layout.addWidget(hk_refresh_input)
+            hk_refresh_layout.addStretch()
+            scroll_layout.addLayout(hk_refresh_layout)
+
+            # --- Session Section ---
+            session_header = QLabel("Session")
+            session_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
+            scroll_layout.addWidget(session_header)
+
+            session_label = QLabel("Session Key")
+            session_label.setStyleSheet(label_style)
+            scroll_layout.addWidget(session_label)
+
+            session_input = QLineEdit()
+            session_input.setStyleSheet(input_style)
+            session_input.setText(self.config.get('session_key', '') or '')
+            session_input.setEchoMode(QLineEdit.Password)
+            def on_session_change():
+                key = session_input.text().strip()
+                self.config['session_key'] = key if key else None
+                self.save_config()
+            session_input.editingFinished.connect(on_session_change)
+            scroll_layout.addWidget(session_input)
+            self.settings_widgets['session_key'] = session_input
+
+            # Button row for session actions
+            session_btn_layout = QHBoxLayout()
+            scroll_layout.addLayout(session_btn_layout)
+
+            # Show/hide session key button
+            show_key_btn = QPushButton("Show Key")
+            show_key_btn.setStyleSheet("background-color: #333; color: #aaa; padding: 5px;")
+            def toggle_show_key():
+                if session_input.echoMode() == QLineEdit.Password:
+                    session_input.setEchoMode(QLineEdit.Normal)
+                    show_key_btn.setText("Hide Key")
+                else:
+                    session_input.setEchoMode(QLineEdit.Password)
+                    show_key_btn.setText("Show Key")
+            show_key_btn.clicked.connect(toggle_show_key)
+            session_btn_layout.addWidget(show_key_btn)
+
+            # Clear key button
+            clear_key_btn = QPushButton("Clear Key")
+            clear_key_btn.setStyleSheet("background-color: #333; color: #aaa; padding: 5px;")
+            def clear_key():
+                session_input.clear()
+                self.config['session_key'] = None
+                self.save_config()
+            clear_key_btn.clicked.connect(clear_key)
+            session_btn_layout.addWidget(clear_key_btn)
 
-        # --- Hotkeys Section ---
-        hotkeys_header = QLabel("Global Hotkeys")
-        hotkeys_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
-        scroll_layout.addWidget(hotkeys_header)
+            scroll_layout.addStretch()
 
-        if not KEYBOARD_AVAILABLE:
-            hotkey_warning = QLabel("Install 'keyboard' module: pip install keyboard")
-            hotkey_warning.setStyleSheet("color: #ffaa44; font-size: 11px;")
-            scroll_layout.addWidget(hotkey_warning)
-        else:
-            hotkey_info = QLabel("Click input and press keys (Esc/Backspace to clear)")
-            hotkey_info.setStyleSheet("color: #777777; font-size: 11px;")
-            scroll_layout.addWidget(hotkey_info)
-
-        # Clickthrough hotkey
-        hk_click_layout = QHBoxLayout()
-        hk_click_layout.addStretch()
-        hk_click_label = QLabel("Clickthrough:")
-        hk_click_label.setStyleSheet("color: #cccccc;")
-        hk_click_label.setFixedWidth(70)
-        hk_click_layout.addWidget(hk_click_label)
-        hk_click_input = HotkeyEdit()
-        hk_click_input.setStyleSheet(input_style)
-        hk_click_input.setFixedWidth(80)
-        hk_click_input.setText(self.config.get('hotkey_clickthrough', 'ctrl+alt+c'))
-        hk_click_input.setEnabled(KEYBOARD_AVAILABLE)
-        def on_hk_click_change():
-            self.config['hotkey_clickthrough'] = hk_click_input.text().strip()
-            self.save_config()
-            if KEYBOARD_AVAILABLE:
-                self.setup_hotkeys()
-        hk_click_input.textChanged.connect(on_hk_click_change)
-        hk_click_layout.addWidget(hk_click_input)
-        hk_click_layout.addStretch()
-        scroll_layout.addLayout(hk_click_layout)
-
-        # Compact hotkey
-        hk_compact_layout = QHBoxLayout()
-        hk_compact_layout.addStretch()
-        hk_compact_label = QLabel("Compact:")
-        hk_compact_label.setStyleSheet("color: #cccccc;")
-        hk_compact_label.setFixedWidth(70)
-        hk_compact_layout.addWidget(hk_compact_label)
-        hk_compact_input = HotkeyEdit()
-        hk_compact_input.setStyleSheet(input_style)
-        hk_compact_input.setFixedWidth(80)
-        hk_compact_input.setText(self.config.get('hotkey_compact', 'ctrl+alt+m'))
-        hk_compact_input.setEnabled(KEYBOARD_AVAILABLE)
-        def on_hk_compact_change():
-            self.config['hotkey_compact'] = hk_compact_input.text().strip()
-            self.save_config()
-            if KEYBOARD_AVAILABLE:
-                self.setup_hotkeys()
-        hk_compact_input.textChanged.connect(on_hk_compact_change)
-        hk_compact_layout.addWidget(hk_compact_input)
-        hk_compact_layout.addStretch()
-        scroll_layout.addLayout(hk_compact_layout)
-
-        # Refresh hotkey
-        hk_refresh_layout = QHBoxLayout()
-        hk_refresh_layout.addStretch()
-        hk_refresh_label = QLabel("Refresh:")
-        hk_refresh_label.setStyleSheet("color: #cccccc;")
-        hk_refresh_label.setFixedWidth(70)
-        hk_refresh_layout.addWidget(hk_refresh_label)
-        hk_refresh_input = HotkeyEdit()
-        hk_refresh_input.setStyleSheet(input_style)
-        hk_refresh_input.setFixedWidth(80)
-        hk_refresh_input.setText(self.config.get('hotkey_refresh', 'ctrl+alt+r'))
-        hk_refresh_input.setEnabled(KEYBOARD_AVAILABLE)
-        def on_hk_refresh_change():
-            self.config['hotkey_refresh'] = hk_refresh_input.text().strip()
-            self.save_config()
-            if KEYBOARD_AVAILABLE:
-                self.setup_hotkeys()
-        hk_refresh_input.textChanged.connect(on_hk_refresh_change)
-        hk_refresh_layout.addWidget(hk_refresh_input)
-        hk_refresh_layout.addStretch()
-        scroll_layout.addLayout(hk_refresh_layout)
-
-        # --- Session Section ---
-        session_header = QLabel("Session")
-        session_header.setStyleSheet("color: #CC785C; font-weight: bold; font-size: 16px; margin-top: 15px;")
-        scroll_layout.addWidget(session_header)
-
-        session_label = QLabel("Session Key")
-        session_label.setStyleSheet(label_style)
-        scroll_layout.addWidget(session_label)
-
-        session_input = QLineEdit()
-        session_input.setStyleSheet(input_style)
-        session_input.setText(self.config.get('session_key', '') or '')
-        session_input.setEchoMode(QLineEdit.Password)
-        def on_session_change():
-            key = session_input.text().strip()
-            self.config['session_key'] = key if key else None
-            self.save_config()
-        session_input.editingFinished.connect(on_session_change)
-        scroll_layout.addWidget(session_input)
-        self.settings_widgets['session_key'] = session_input
-
-        # Button row for session actions
-        session_btn_layout = QHBoxLayout()
-        scroll_layout.addLayout(session_btn_layout)
-
-        # Show/hide session key button
-        show_key_btn = QPushButton("Show Key")
-        show_key_btn.setStyleSheet("background-color: #333; color: #aaa; padding: 5px;")
-        def toggle_show_key():
-            if session_input.echoMode() == QLineEdit.Password:
-                session_input.setEchoMode(QLineEdit.Normal)
-                show_key_btn.setText("Hide Key")
-            else:
-                session_input.setEchoMode(QLineEdit.Password)
-                show_key_btn.setText("Show Key")
-        show_key_btn.clicked.connect(toggle_show_key)
-        session_btn_layout.addWidget(show_key_btn)
-
-        # Clear key button
-        clear_key_btn = QPushButton("Clear Key")
-        clear_key_btn.setStyleSheet("background-color: #333; color: #aaa; padding: 5px;")
-        def clear_key():
-            session_input.clear()
-            self.config['session_key'] = None
-            self.save_config()
-        clear_key_btn.clicked.connect(clear_key)
-        session_btn_layout.addWidget(clear_key_btn)
+        def build_lower_sections_frozen():
+            # The dialog is already showing, so hold repaints until every row is in
+            scroll_widget.setUpdatesEnabled(False)
+            try:
+                build_lower_sections()
+            finally:
+                scroll_widget.setUpdatesEnabled(True)
 
-        scroll_layout.addStretch()
+        QTimer.singleShot(0, build_lower_sections_frozen)
 
-        self.settings_window.show()
+    def _on_threshold_slider(self, val):
+        """Handle a threshold slider move (shared by every threshold row)"""
+        slider = self.sender()
+        slider.property('value_label').setText(f"{val}%")
+        thresholds = self.config.get('notification_thresholds', [70, 90])
+        # Row position is looked up, rows above may have been removed
+        idx = self._threshold_rows.index(slider.property('row'))
+        old_val = thresholds[idx]
+        thresholds[idx] = val
+        self.config['notification_thresholds'] = thresholds
+        self.save_config()
+        # Update notified thresholds tracking
+        self._forget_threshold_alerts(old_val)
 
     def on_close(self):
         """Handle close button"""
         if self.clickthrough_enabled:
             return
 
-        if TRAY_AVAILABLE and self.config.get('minimize_to_tray'):
-            self.hide()
-            self.is_hidden = True
-        else:
-            self.quit_app()
+        self._close_action()
+
+    def hide_to_tray(self):
+        """Hide window to the system tray"""
+        self.hide()
+        self.is_hidden = True
 
     def quit_app(self):
         """Quit the application"""
+        self._shutdown.set()
         self.polling_active = False
-        if hasattr(self, 'monitor_timer'):
-            self.monitor_timer.stop()
-        if hasattr(self, 'polling_thread') and self.polling_thread.is_alive():
-            self.polling_thread.join(timeout=2)
+        self._poll_timer.stop()
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._close_mci()
         if self.tray_icon:
             self.tray_icon.stop()
         if self.driver:
@@ -1927,16 +2125,18 @@ class ClaudeUsageBar(QMainWindow):
         QApplication.quit()
 
     def get_app_icon(self):
-        """Get the app icon (orange circle)"""
-        icon_pixmap = QPixmap(64, 64)
-        icon_pixmap.fill(Qt.transparent)
-        painter = QPainter(icon_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QBrush(QColor("#CC785C")))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(4, 4, 56, 56)
-        painter.end()
-        return QIcon(icon_pixmap)
+        """Get the app icon (orange circle, drawn once)"""
+        if self._app_icon is None:
+            icon_pixmap = QPixmap(64, 64)
+            icon_pixmap.fill(Qt.transparent)
+            painter = QPainter(icon_pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(QBrush(QColor("#CC785C")))
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(4, 4, 56, 56)
+            painter.end()
+            self._app_icon = QIcon(icon_pixmap)
+        return self._app_icon
 
     def apply_dark_titlebar(self, window):
         """Apply dark title bar and app icon to a window"""
@@ -1944,9 +2144,8 @@ class ClaudeUsageBar(QMainWindow):
 
         # Enable dark title bar on Windows
         try:
-            hwnd = int(window.winId())
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(ctypes.c_int(1)), 4)
+            DwmSetWindowAttribute(int(window.winId()), DWMWA_USE_IMMERSIVE_DARK_MODE,
+                                  ctypes.byref(_DARK_MODE_ON), ctypes.sizeof(_DARK_MODE_ON))
         except:
             pass
 
@@ -2038,16 +2237,17 @@ class ClaudeUsageBar(QMainWindow):
         def update_status(text, color="#999999"):
             status_label.setText(text)
             status_label.setStyleSheet(f"color: {color}; font-size: 13px;")
-            QApplication.processEvents()
 
         def on_signin():
             logging.info("Sign In button clicked")
             signin_btn.setEnabled(False)
             cancel_btn.setEnabled(False)
             update_status("Launching browser...")
-            QApplication.processEvents()
 
-            session_key = self.auto_grab_session_key(update_status)
+            # The browser wait runs off the GUI thread; status and result come back as signals
+            threading.Thread(target=self._login_worker, daemon=True).start()
+
+        def on_login_done(session_key):
             logging.info(f"auto_grab_session_key returned: {'key found' if session_key else 'None'}")
             if session_key:
                 self.config['session_key'] = session_key
@@ -2057,12 +2257,16 @@ class ClaudeUsageBar(QMainWindow):
                 QTimer.singleShot(500, self.start_polling)
             else:
                 logging.info("Re-enabling login dialog")
-                signin_btn.setEnabled(True)
+                signin_btn.setEnabled(CHROMEDRIVER_AVAILABLE)
+                if not CHROMEDRIVER_AVAILABLE:
+                    signin_btn.setToolTip("Install undetected-chromedriver: pip install undetected-chromedriver setuptools")
                 cancel_btn.setEnabled(True)
                 dialog.raise_()
                 dialog.activateWindow()
 
         signin_btn.clicked.connect(on_signin)
+        self.login_status_signal.connect(update_status)
+        self.login_result_signal.connect(on_login_done)
         layout.addWidget(signin_btn)
 
         # Cancel button
@@ -2086,11 +2290,19 @@ class ClaudeUsageBar(QMainWindow):
         dialog.setFixedSize(main_widget.size())
 
         result = dialog.exec_()
+        self.login_status_signal.disconnect(update_status)
+        self.login_result_signal.disconnect(on_login_done)
         if result == QDialog.Rejected and not self.config.get('session_key'):
             self.quit_app()
 
+    def _login_worker(self):
+        """Run the browser sign-in on a worker thread and report back via signals"""
+        session_key = self.auto_grab_session_key(self.login_status_signal.emit)
+        self.login_result_signal.emit(session_key)
+
     def auto_grab_session_key(self, update_status=None):
         """Launch browser to grab session key automatically"""
+        global CHROMEDRIVER_AVAILABLE
         logging.info("auto_grab_session_key called")
 
         def status(text, color="#999999"):
@@ -2106,6 +2318,17 @@ class ClaudeUsageBar(QMainWindow):
             logging.warning("login_in_progress is True, returning")
             return None
 
+        try:
+            import undetected_chromedriver as uc
+            from selenium.common.exceptions import TimeoutException
+            from selenium.webdriver.support.ui import WebDriverWait
+        except ImportError as e:
+            # Installed but not importable (e.g. missing distutils): treat it as not installed
+            logging.warning(f"undetected_chromedriver not available: {e}")
+            CHROMEDRIVER_AVAILABLE = False
+            status("⚠ Missing dependency: undetected-chromedriver", "#ffaa44")
+            return None
+
         self.login_in_progress = True
         session_key = None
 
@@ -2125,28 +2348,28 @@ class ClaudeUsageBar(QMainWindow):
 
             # Wait for login (check for sessionKey cookie)
             max_wait = 300  # 5 minutes
-            start_time = time.time()
             all_cookies = None
 
             logging.info("Waiting for sessionKey cookie...")
-            while time.time() - start_time < max_wait:
-                try:
-                    cookies = self.driver.get_cookies()
-                    for cookie in cookies:
-                        if cookie.get('name') == 'sessionKey':
-                            session_key = cookie.get('value')
-                            all_cookies = cookies
-                            logging.info("sessionKey cookie found!")
-                            break
-                    if session_key:
-                        break
-                except Exception:
-                    # Browser was closed manually
-                    logging.info("Browser closed by user")
-                    self.driver = None
-                    status("Browser closed", "#ffaa44")
-                    return None
-                time.sleep(2)  # Poll every 2 seconds like original
+
+            def signed_in(driver):
+                # Ask for the one cookie; True (app quitting) also ends the wait
+                return self._shutdown.is_set() or driver.get_cookie('sessionKey')
+
+            try:
+                cookie = WebDriverWait(self.driver, max_wait, poll_frequency=0.5).until(signed_in)
+            except TimeoutException:
+                cookie = None
+            except Exception:
+                # Browser was closed manually
+                logging.info("Browser closed by user")
+                self.driver = None
+                status("Browser closed", "#ffaa44")
+                return None
+            if isinstance(cookie, dict):
+                session_key = cookie.get('value')
+                all_cookies = self.driver.get_cookies()  # Full list only once signed in
+                logging.info("sessionKey cookie found!")
 
             logging.info("Closing browser")
             if self.driver:
@@ -2179,7 +2402,24 @@ class ClaudeUsageBar(QMainWindow):
 
         return session_key
 
-    def fetch_usage_data(self, retry_attempt=0):
+    def _get_scraper(self):
+        """Return the shared cloudscraper session (only used from the fetch worker)"""
+        if self._scraper is None:
+            try:
+                import cloudscraper
+            except ImportError:
+                import subprocess
+                subprocess.check_call([sys.executable, "-m", "pip", "install", "cloudscraper"])
+                import cloudscraper
+
+            self._scraper = cloudscraper.create_scraper(
+                browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
+            )
+            self._scraper.headers.update(API_HEADERS)
+            self._cookie_signature = None  # New session starts without cookies
+        return self._scraper
+
+    def fetch_usage_data(self):
         """Fetch usage data from Claude API with retry logic"""
         if not self.config.get('session_key'):
             self.api_status = 'error'
@@ -2189,97 +2429,114 @@ class ClaudeUsageBar(QMainWindow):
         max_retries = 3
         base_delay = 2
 
-        try:
-            if retry_attempt > 0:
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                # Exponential backoff with a little jitter; quitting cancels the wait
+                delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 0.5)  # 2s, 4s, 8s
+                if self._shutdown.wait(delay):
+                    return None
                 self.api_status = 'warning'
                 QTimer.singleShot(0, self.update_api_status_ui)
 
             try:
-                import cloudscraper
-            except ImportError:
-                import subprocess
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "cloudscraper"])
-                import cloudscraper
+                data = self._request_usage()
+            except Exception as e:
+                logging.error(f"Fetch error: {type(e).__name__}: {e}")
+                continue
+            if data is not None:
+                self.api_status = 'ok'
+                self.last_api_error = None
+                QTimer.singleShot(0, self.update_api_status_ui)
+                return data
 
-            scraper = cloudscraper.create_scraper(
-                browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
-            )
+        self.api_status = 'error'
+        QTimer.singleShot(0, self.update_api_status_ui)
+        return None
 
-            cookie_string = self.config.get('cookie_string', f'sessionKey={self.config["session_key"]}')
+    def _request_usage(self):
+        """One attempt at the usage request, None on a non-200 response"""
+        scraper = self._get_scraper()
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://claude.ai/chats',
-            }
+        cookie_string = self.config.get('cookie_string', f'sessionKey={self.config["session_key"]}')
 
+        # The session keeps its cookies, so they are only reloaded when the cookie string changes
+        if cookie_string != self._cookie_signature:
+            scraper.cookies.clear()
             for cookie_pair in cookie_string.split('; '):
                 if '=' in cookie_pair:
                     name, value = cookie_pair.split('=', 1)
                     scraper.cookies.set(name, value, domain='claude.ai')
+            self._cookie_signature = cookie_string
 
-            response = scraper.get('https://claude.ai/api/organizations', headers=headers, timeout=15)
-
+        # The org id rarely changes, so the organizations list is only fetched when it isn't known
+        org_id = self._org_id
+        if not org_id:
+            response = scraper.get('https://claude.ai/api/organizations', timeout=15)
             if response.status_code == 200:
                 orgs = response.json()
                 if orgs and len(orgs) > 0:
-                    org_id = orgs[0].get('uuid')
-                    usage_response = scraper.get(
-                        f'https://claude.ai/api/organizations/{org_id}/usage',
-                        headers=headers, timeout=15
-                    )
-                    if usage_response.status_code == 200:
-                        self.api_status = 'ok'
-                        self.last_api_error = None
-                        QTimer.singleShot(0, self.update_api_status_ui)
-                        return usage_response.json()
-
-            if retry_attempt < max_retries:
-                time.sleep(base_delay * (2 ** retry_attempt))
-                return self.fetch_usage_data(retry_attempt + 1)
-
-            self.api_status = 'error'
-            QTimer.singleShot(0, self.update_api_status_ui)
-            return None
+                    org_id = self._org_id = orgs[0].get('uuid')
 
-        except Exception as e:
-            logging.error(f"Fetch error: {type(e).__name__}: {e}")
-            if retry_attempt < max_retries:
-                time.sleep(base_delay * (2 ** retry_attempt))
-                return self.fetch_usage_data(retry_attempt + 1)
-            self.api_status = 'error'
-            return None
+        if org_id:
+            usage_response = scraper.get(
+                f'https://claude.ai/api/organizations/{org_id}/usage',
+                timeout=15
+            )
+            if usage_response.status_code == 200:
+                data = usage_response.json()
+                # Parse reset times here on the worker so the GUI thread only does the arithmetic
+                for limit in ('five_hour', 'seven_day'):
+                    block = data.get(limit)
+                    if block and block.get('resets_at'):
+                        try:
+                            block['reset_dt'] = _parse_iso(block['resets_at'])
+                        except (ValueError, OverflowError):
+                            logging.warning(f"Unreadable reset time: {block['resets_at']}")
+                return data
+            if usage_response.status_code in (401, 403, 404):
+                self._org_id = None  # Cached org may be stale (other account), look it up again
+            if usage_response.status_code == 403:
+                self._scraper = None  # Cloudflare clearance may have expired, retry on a fresh session
+        elif response.status_code == 403:
+            self._scraper = None
+        return None
 
     def update_api_status_ui(self):
         """Update API status dot color"""
         colors = {'ok': '#44ff44', 'warning': '#ffaa44', 'error': '#ff4444', 'unknown': '#888888'}
-        self.api_status_dot.setStyleSheet(f"color: {colors.get(self.api_status, '#888888')}; background: transparent; font-size: 12px; padding: 0px; margin: 0px;")
+        self.api_status_dot.setStyleSheet(f"color: {colors.get(self.api_status, '#888888')}; font-size: 12px; padding: 0px; margin: 0px;")
 
     def format_time_remaining(self, time_left_seconds):
         """Format time remaining"""
         if time_left_seconds <= 0:
             return "Resetting soon..."
-        hours = int(time_left_seconds // 3600)
-        minutes = int((time_left_seconds % 3600) // 60)
-        seconds = int(time_left_seconds % 60)
-        if hours > 0:
+        return self._format_seconds(int(time_left_seconds))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _format_seconds(seconds):
+        """Format whole seconds as "2h 5m", "5m 30s" or "30s" (repeats hit the cache)"""
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
             return f"{hours}h {minutes}m"
-        elif minutes > 0:
+        if minutes:
             return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return f"{seconds}s"
 
-    def calculate_prediction(self, current_utilization):
-        """Calculate time until 100% based on usage rate"""
-        now = time.time()
+    def calculate_prediction(self, current_utilization, record=True):
+        """Calculate time until 100% based on usage rate (record adds the reading to the history)"""
+        now = time.monotonic()  # Only differences are used, so clock changes do not skew the rate
 
-        # Keep only last 30 minutes of data (filter before append to avoid memory spike)
+        # Keep only last 30 minutes of data (oldest readings are at the front)
         cutoff = now - (30 * 60)
-        self.usage_history = [(t, u) for t, u in self.usage_history if t > cutoff]
+        history = self.usage_history
+        while history and history[0][0] <= cutoff:
+            history.popleft()
 
         # Add current reading to history
-        self.usage_history.append((now, current_utilization))
+        if record:
+            history.append((now, current_utilization))
 
         # Need at least 2 data points spread over 2+ minutes
         if len(self.usage_history) < 2:
@@ -2311,106 +2568,71 @@ class ClaudeUsageBar(QMainWindow):
 
         return seconds_to_100
 
-    def update_progress(self):
-        """Update UI with latest usage data"""
+    def update_progress(self, record_sample=True):
+        """Update UI with latest usage data (record_sample=False repaints without adding prediction history)"""
         if not self.usage_data:
             return
 
+        compact = self._compact
+        if self.is_hidden and not self.isVisible():
+            # Hidden in the tray: skip the widgets (showEvent catches them up), keep alerts and tooltip current
+            five_hour_utilization = self.usage_data.get('five_hour', {}).get('utilization', 0.0)
+            if not compact and self._show_prediction:
+                self.calculate_prediction(five_hour_utilization)  # Keep the prediction history filling
+            self.check_and_notify(five_hour_utilization, "5-hour")
+            self.check_and_notify(self.usage_data.get('seven_day', {}).get('utilization', 0.0), "weekly")
+            self.initial_thresholds_set = True
+            self.update_tray_tooltip()
+            return
+
         try:
-            from dateutil import parser as date_parser
+            now = datetime.now(timezone.utc)
 
             five_hour = self.usage_data.get('five_hour', {})
             five_hour_utilization = five_hour.get('utilization', 0.0)
-            five_hour_resets_at = five_hour.get('resets_at')
-
-            compact_reset_text = ""
-            if self.config.get('compact_mode', False) and five_hour_resets_at:
-                try:
-                    reset_time = date_parser.parse(five_hour_resets_at)
-                    now = datetime.now(reset_time.tzinfo)
-                    time_left = reset_time - now
-                    if time_left.total_seconds() > 0:
-                        time_str = self.format_time_remaining(time_left.total_seconds())
-                        compact_reset_text = f" • Resets: {time_str}"
-                except:
-                    pass
+            five_hour_left = _seconds_until(five_hour.get('reset_dt'), now)
 
-            if self.config.get('compact_mode', False):
-                self.five_hour_usage_label.setText(f"5h: {five_hour_utilization:.1f}% used{compact_reset_text}")
+            if compact:
+                compact_reset_text = ""
+                if five_hour_left > 0:
+                    compact_reset_text = f" • Resets: {self.format_time_remaining(five_hour_left)}"
+                self._set_text(self.five_hour_usage_label, f"5h: {five_hour_utilization:.1f}% used{compact_reset_text}")
             else:
-                self.five_hour_usage_label.setText(f"{five_hour_utilization:.1f}% used")
+                self._set_text(self.five_hour_usage_label, f"{five_hour_utilization:.1f}% used")
 
             # Calculate fill width
-            max_width = self.five_hour_progress_bg.width()
-            bar_width = int((five_hour_utilization / 100) * max_width)
-            self.five_hour_progress_fill.setFixedWidth(bar_width)
-
-            if self.config.get('dynamic_bar_color', True):
-                if five_hour_utilization >= 90:
-                    color = self.config.get('warning_color_90', '#ff4444')
-                elif five_hour_utilization >= 70:
-                    color = self.config.get('warning_color_70', '#ffaa44')
-                else:
-                    color = self.config.get('five_hour_color', '#CC785C')
-            else:
-                color = self.config.get('five_hour_color', '#CC785C')
-            self.five_hour_progress_fill.setStyleSheet(f"background-color: {color}; border: none;")
+            self._set_bar_width(self.five_hour_progress_fill, self.five_hour_progress_bg, five_hour_utilization)
+            self._set_bar_color(self.five_hour_progress_fill, self._bar_color(five_hour_utilization, self._five_hour_color))
 
-            if five_hour_resets_at and not self.config.get('compact_mode', False):
-                try:
-                    reset_time = date_parser.parse(five_hour_resets_at)
-                    now = datetime.now(reset_time.tzinfo)
-                    time_left = reset_time - now
-                    if time_left.total_seconds() > 0:
-                        self.five_hour_reset_label.setText(f"Resets in: {self.format_time_remaining(time_left.total_seconds())}")
-                except:
-                    pass
+            if five_hour_left > 0 and not compact:
+                self._set_text(self.five_hour_reset_label, f"Resets in: {self.format_time_remaining(five_hour_left)}")
 
             # Update prediction
-            if not self.config.get('compact_mode', False) and self.config.get('show_prediction', True):
-                prediction = self.calculate_prediction(five_hour_utilization)
+            if not compact and self._show_prediction:
+                prediction = self.calculate_prediction(five_hour_utilization, record_sample)
                 if prediction:
                     pred_text = f"→ 100% in ~{self.format_time_remaining(prediction)}"
-                    self.prediction_label.setText(pred_text)
+                    self._set_text(self.prediction_label, pred_text)
                 else:
-                    self.prediction_label.setText("→ 100% in ~—")
+                    self._set_text(self.prediction_label, "→ 100% in ~—")
                 self.prediction_label.show()
             else:
                 self.prediction_label.hide()
 
             weekly = self.usage_data.get('seven_day', {})
             weekly_utilization = weekly.get('utilization', 0.0)
-            weekly_resets_at = weekly.get('resets_at')
 
             # Only update weekly labels if not in compact mode (they're hidden in compact mode)
-            if not self.config.get('compact_mode', False):
-                self.weekly_usage_label.setText(f"{weekly_utilization:.1f}% used")
+            if not compact:
+                self._set_text(self.weekly_usage_label, f"{weekly_utilization:.1f}% used")
 
-                if weekly_resets_at:
-                    try:
-                        reset_time = date_parser.parse(weekly_resets_at)
-                        now = datetime.now(reset_time.tzinfo)
-                        time_left = reset_time - now
-                        if time_left.total_seconds() > 0:
-                            self.weekly_reset_label.setText(f"Resets in: {self.format_time_remaining(time_left.total_seconds())}")
-                    except:
-                        pass
+                weekly_left = _seconds_until(weekly.get('reset_dt'), now)
+                if weekly_left > 0:
+                    self._set_text(self.weekly_reset_label, f"Resets in: {self.format_time_remaining(weekly_left)}")
 
             # Calculate weekly fill width
-            weekly_max_width = self.weekly_progress_bg.width()
-            weekly_bar_width = int((weekly_utilization / 100) * weekly_max_width)
-            self.weekly_progress_fill.setFixedWidth(weekly_bar_width)
-
-            if self.config.get('dynamic_bar_color', True):
-                if weekly_utilization >= 90:
-                    color = self.config.get('warning_color_90', '#ff4444')
-                elif weekly_utilization >= 70:
-                    color = self.config.get('warning_color_70', '#ffaa44')
-                else:
-                    color = self.config.get('weekly_color', '#8B6BB7')
-            else:
-                color = self.config.get('weekly_color', '#8B6BB7')
-            self.weekly_progress_fill.setStyleSheet(f"background-color: {color}; border: none;")
+            self._set_bar_width(self.weekly_progress_fill, self.weekly_progress_bg, weekly_utilization)
+            self._set_bar_color(self.weekly_progress_fill, self._bar_color(weekly_utilization, self._weekly_color))
 
             # Check for notification thresholds
             self.check_and_notify(five_hour_utilization, "5-hour")
@@ -2421,46 +2643,64 @@ class ClaudeUsageBar(QMainWindow):
             self.update_tray_tooltip()
 
         except Exception as e:
-            self.five_hour_usage_label.setText("Error")
-            if not self.config.get('compact_mode', False):
-                self.weekly_usage_label.setText("Error")
+            self._set_text(self.five_hour_usage_label, "Error")
+            if not compact:
+                self._set_text(self.weekly_usage_label, "Error")
 
     def start_polling(self):
         """Start background polling"""
         logging.info("start_polling called")
         self.polling_active = True
+        self._poll_timer.start(500)
+
+    def _poll_once(self):
+        """Run one fetch on the worker thread"""
+        logging.info("Fetching usage data...")
+        self._submit_fetch()
 
-        def poll_loop():
-            logging.info("poll_loop started")
-            while self.polling_active:
-                logging.info("Fetching usage data...")
-                data = self.fetch_usage_data()
-                logging.info(f"Fetch result: {bool(data)}")
-                if data:
-                    self.usage_data = data
-                    QTimer.singleShot(0, self.update_progress)
-                time.sleep(self.config['poll_interval'])
-
-        self.polling_thread = threading.Thread(target=poll_loop, daemon=True)
-        self.polling_thread.start()
-
-        def initial_fetch():
-            time.sleep(0.5)
+    def _submit_fetch(self):
+        """Queue a fetch unless one is already running; returns whether one was queued"""
+        if self._fetch_inflight:
+            return False
+        self._fetch_inflight = True
+        self._fetch_pool.submit(self._poll_job).add_done_callback(self._on_fetch_done)
+        return True
+
+    def _on_fetch_done(self, future):
+        """Done callback shared by polls and manual refreshes (runs on the worker)"""
+        self._fetch_inflight = False
+
+    def _poll_job(self):
+        """Worker side of a poll; always reports back so the timer is re-armed"""
+        data = None
+        try:
             data = self.fetch_usage_data()
-            if data:
-                self.usage_data = data
-                QTimer.singleShot(0, self.update_progress)
+        finally:
+            logging.info(f"Fetch result: {bool(data)}")
+            self.poll_result_signal.emit(data)
+
+    def _on_poll_result(self, data):
+        """Apply poll result and schedule the next poll (GUI thread)"""
+        if data:
+            self.usage_data = data
+            self.update_progress()
+            if self._org_id != self.config.get('cached_org_id'):
+                self.config['cached_org_id'] = self._org_id
+                self.save_config()
+        if self.polling_active:
+            self._poll_timer.start(self.config['poll_interval'] * 1000)
 
-        threading.Thread(target=initial_fetch, daemon=True).start()
+    def _forget_threshold_alerts(self, threshold):
+        """Drop the notified state of a threshold for every limit"""
+        suffix = str(threshold)
+        self.notified_thresholds.difference_update([p + suffix for p in self._ALERT_PREFIXES])
 
     def check_and_notify(self, utilization, limit_type="5-hour"):
         """Check if utilization crossed any notification thresholds"""
-        if not self.config.get('notifications_enabled', True):
+        if not self._notifications_enabled:
             return
 
-        thresholds = self.config.get('notification_thresholds', [70, 90])
-        for threshold in sorted(thresholds):
-            key = f"{limit_type}_{threshold}"
+        for threshold, key in self._threshold_keys[limit_type]:
             if utilization >= threshold and key not in self.notified_thresholds:
                 self.notified_thresholds.add(key)
                 # Only send notification if not first fetch (avoid re-notifying on restart)
@@ -2519,31 +2759,44 @@ class ClaudeUsageBar(QMainWindow):
     def play_mp3(self, filepath):
         """Play MP3 using Windows MCI"""
         try:
-            winmm = ctypes.windll.winmm
-            # Close any previous sound
-            winmm.mciSendStringW('close mp3_sound', None, 0, None)
-            # Open file
-            winmm.mciSendStringW(f'open "{filepath}" type mpegvideo alias mp3_sound', None, 0, None)
-            # Set volume (0-1000 scale)
-            volume = self.config.get('sound_volume', 100) * 10
-            winmm.mciSendStringW(f'setaudio mp3_sound volume to {volume}', None, 0, None)
-            # Play
-            winmm.mciSendStringW('play mp3_sound', None, 0, None)
+            self._play_mci('mp3_sound', 'mpegvideo', filepath)
         except Exception as e:
             logging.error(f"MP3 error: {e}")
 
     def play_wav_with_volume(self, filepath):
         """Play WAV using Windows MCI with volume control"""
         try:
-            winmm = ctypes.windll.winmm
-            winmm.mciSendStringW('close wav_sound', None, 0, None)
-            winmm.mciSendStringW(f'open "{filepath}" type waveaudio alias wav_sound', None, 0, None)
-            volume = self.config.get('sound_volume', 100) * 10
-            winmm.mciSendStringW(f'setaudio wav_sound volume to {volume}', None, 0, None)
-            winmm.mciSendStringW('play wav_sound', None, 0, None)
+            self._play_mci('wav_sound', 'waveaudio', filepath)
         except Exception as e:
             logging.error(f"WAV error: {e}")
 
+    def _play_mci(self, alias, device_type, filepath):
+        """Play a file on an MCI alias, keeping it open between alerts"""
+        winmm = ctypes.windll.winmm
+        volume = self.config.get('sound_volume', 100) * 10  # 0-1000 scale
+        opened_path, applied_volume = self._mci_state.get(alias, (None, None))
+        # Reopen only when the file changed; replays just rewind the open device
+        if opened_path != filepath:
+            self._mci_state.pop(alias, None)
+            winmm.mciSendStringW(f'close {alias}', None, 0, None)
+            if winmm.mciSendStringW(f'open "{filepath}" type {device_type} alias {alias}', None, 0, None):
+                logging.error(f"Could not open sound file: {filepath}")
+                return
+            applied_volume = None
+        if applied_volume != volume:
+            winmm.mciSendStringW(f'setaudio {alias} volume to {volume}', None, 0, None)
+        self._mci_state[alias] = (filepath, volume)
+        winmm.mciSendStringW(f'play {alias} from 0', None, 0, None)
+
+    def _close_mci(self):
+        """Close the MCI aliases kept open for custom alert sounds"""
+        if not self._mci_state:
+            return
+        winmm = ctypes.windll.winmm
+        for alias in self._mci_state:
+            winmm.mciSendStringW(f'close {alias}', None, 0, None)
+        self._mci_state.clear()
+
     def set_auto_start(self, enabled):
         """Enable or disable auto-start on Windows boot"""
         try:
@@ -2551,8 +2804,6 @@ class ClaudeUsageBar(QMainWindow):
             key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
             app_name = "ClaudeUsage"
 
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE)
-
             if enabled:
                 # Get the path to the current script/exe
                 if getattr(sys, 'frozen', False):
@@ -2561,14 +2812,23 @@ class ClaudeUsageBar(QMainWindow):
                 else:
                     # Running as script
                     app_path = f'pythonw "{os.path.abspath(__file__)}"'
-                winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, app_path)
             else:
+                app_path = None
+
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE) as key:
+                # Only write to the registry when the entry actually needs to change
                 try:
-                    winreg.DeleteValue(key, app_name)
+                    current = winreg.QueryValueEx(key, app_name)[0]
                 except FileNotFoundError:
-                    pass  # Key doesn't exist, nothing to delete
+                    current = None  # No entry yet
+                if current == app_path:
+                    return True
+
+                if enabled:
+                    winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, app_path)
+                else:
+                    winreg.DeleteValue(key, app_name)
 
-            winreg.CloseKey(key)
             return True
         except Exception as e:
             logging.error(f"Auto-start error: {e}")
@@ -2576,8 +2836,7 @@ class ClaudeUsageBar(QMainWindow):
 
     def _start_minimized(self):
         """Hide window to tray at startup"""
-        self.hide()
-        self.is_hidden = True
+        self.hide_to_tray()
 
     def setup_hotkeys(self):
         """Setup global hotkeys"""
@@ -2586,59 +2845,57 @@ class ClaudeUsageBar(QMainWindow):
             return
 
         try:
+            import keyboard
+
             # Clear any existing hotkeys
             try:
                 keyboard.unhook_all_hotkeys()
             except:
                 pass
 
-            # Register hotkeys
+            # Register hotkeys (the keyboard hook thread emits the signals, slots run on the GUI thread)
             hk_click = self.config.get('hotkey_clickthrough', 'ctrl+alt+c')
             hk_compact = self.config.get('hotkey_compact', 'ctrl+alt+m')
             hk_refresh = self.config.get('hotkey_refresh', 'ctrl+alt+r')
 
             if hk_click:
-                keyboard.add_hotkey(hk_click, self._on_hotkey_clickthrough, suppress=False)
+                keyboard.add_hotkey(hk_click, self.hotkey_clickthrough_signal.emit, suppress=False)
                 logging.info(f"Registered hotkey: {hk_click}")
             if hk_compact:
-                keyboard.add_hotkey(hk_compact, self._on_hotkey_compact, suppress=False)
+                keyboard.add_hotkey(hk_compact, self.hotkey_compact_signal.emit, suppress=False)
                 logging.info(f"Registered hotkey: {hk_compact}")
             if hk_refresh:
-                keyboard.add_hotkey(hk_refresh, self._on_hotkey_refresh, suppress=False)
+                keyboard.add_hotkey(hk_refresh, self.hotkey_refresh_signal.emit, suppress=False)
                 logging.info(f"Registered hotkey: {hk_refresh}")
 
         except Exception as e:
             logging.error(f"Hotkey setup error: {e}")
 
-    def _on_hotkey_clickthrough(self):
-        """Handle clickthrough hotkey"""
-        self.hotkey_clickthrough_signal.emit()
-
-    def _on_hotkey_compact(self):
-        """Handle compact hotkey"""
-        self.hotkey_compact_signal.emit()
-
-    def _on_hotkey_refresh(self):
-        """Handle refresh hotkey"""
-        self.hotkey_refresh_signal.emit()
-
     def update_tray_tooltip(self):
         """Update the tray icon tooltip with current usage"""
         if self.tray_icon and self.usage_data:
             five_hour = self.usage_data.get('five_hour', {}).get('utilization', 0)
             weekly = self.usage_data.get('seven_day', {}).get('utilization', 0)
             tooltip = f"Claude Usage\n5h: {five_hour:.1f}% | Weekly: {weekly:.1f}%"
-            self.tray_icon.title = tooltip
+            # Setting the title updates the Win32 tray icon, so only do it when the text changes
+            if tooltip != self._last_tooltip:
+                self._last_tooltip = tooltip
+                self.tray_icon.title = tooltip
 
     def create_tray_icon(self):
         """Create system tray icon"""
-        from PIL import Image, ImageDraw
+        global TRAY_AVAILABLE
+        try:
+            import pystray
+            from PIL import Image
+        except ImportError as e:
+            # Installed but not importable: run without a tray, as if it were missing
+            logging.warning(f"System tray not available: {e}")
+            TRAY_AVAILABLE = False
+            self._refresh_config_cache()  # Close button falls back to quitting
+            return
 
-        # Create a simple icon (orange circle on transparent background)
-        size = 64
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw.ellipse([4, 4, size-4, size-4], fill='#CC785C')
+        img = Image.open(io.BytesIO(_TRAY_ICON_PNG))
 
         def on_show(icon, item):
             self.show()
@@ -2652,8 +2909,8 @@ class ClaudeUsageBar(QMainWindow):
             QTimer.singleShot(0, self.show_settings_from_tray)
 
         def on_quit(icon, item):
-            icon.stop()
-            QApplication.quit()
+            # Same shutdown as the close button: cancels waits and the fetch worker
+            self.tray_quit_signal.emit()
 
         menu = pystray.Menu(
             pystray.MenuItem("Show", on_show, default=True),
@@ -2665,12 +2922,12 @@ class ClaudeUsageBar(QMainWindow):
         self.tray_icon = pystray.Icon("Claude Usage", img, "Claude Usage", menu)
 
         # Run tray icon in separate thread
-        import threading
         tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
         tray_thread.start()
 
 
 if __name__ == '__main__':
+    setup_logging()
     app = QApplication(sys.argv)
     # Remove focus rectangles globally
     app.setStyleSheet("""